@@ -6,13 +6,13 @@ import json
 from datetime import datetime
 from src.ads.keywords import list_keywords
 
-def analyze_keyword_performance():
+def analyze_keyword_performance(customer_id='4174586061'):
     """Perform detailed keyword performance analysis for SingleStore."""
     print('🔍 SINGLESTORE KEYWORD PERFORMANCE ANALYSIS')
     print('=' * 60)
     
     # Pull keyword data for SingleStore
-    keywords = list_keywords('4174586061', limit=100)
+    keywords = list_keywords(customer_id, limit=100)
     
     if not keywords:
         print('❌ No keyword data available')
@@ -129,7 +129,7 @@ def analyze_keyword_performance():
     analysis_data = {
         'analysis_date': datetime.now().isoformat(),
         'account': 'SingleStore',
-        'customer_id': '4174586061',
+        'customer_id': customer_id,
         'summary': {
             'total_keywords': len(df),
             'total_impressions': int(df['impressions'].sum()),
@@ -161,5 +161,9 @@ def analyze_keyword_performance():
     
     return analysis_data
 
+def run(customer_id: str = '4174586061') -> dict | None:
+    """Run the analysis in-process and return the saved results (None if no data)."""
+    return analyze_keyword_performance(customer_id)
+
 if __name__ == "__main__":
-    analyze_keyword_performance()
+    run()
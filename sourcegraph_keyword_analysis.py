@@ -6,13 +6,13 @@ import json
 from datetime import datetime
 from src.ads.keywords import list_keywords
 
-def analyze_keyword_performance():
+def analyze_keyword_performance(customer_id='9639990200'):
     """Perform detailed keyword performance analysis."""
     print('🔍 SOURCEGRAPH KEYWORD PERFORMANCE ANALYSIS')
     print('=' * 60)
     
     # Pull keyword data
-    keywords = list_keywords('9639990200', limit=100)
+    keywords = list_keywords(customer_id, limit=100)
     
     if not keywords:
         print('❌ No keyword data available')
@@ -153,5 +153,9 @@ def analyze_keyword_performance():
     
     return analysis_data
 
+def run(customer_id: str = '9639990200') -> dict | None:
+    """Run the analysis in-process and return the saved results (None if no data)."""
+    return analyze_keyword_performance(customer_id)
+
 if __name__ == "__main__":
-    analyze_keyword_performance()
+    run()
@@ -107,6 +107,45 @@ def get_customer_info(customer_id: str) -> dict[str, Any]:
         return {}
 
 
+def get_customer_client_names() -> dict[str, str]:
+    """Get descriptive names for every client under the MCC in one query.
+
+    Streams the manager's ``customer_client`` resource instead of issuing one
+    ``get_customer_info`` call per account. Returns an empty dict when no
+    manager is configured or the query fails, so callers can fall back to
+    per-account lookups.
+    """
+    try:
+        service = create_client_from_env()
+        client = service.client
+
+        login_customer_id = client.login_customer_id
+        if not login_customer_id:
+            return {}
+
+        ga_service = client.get_service("GoogleAdsService")
+        request = client.get_type("SearchGoogleAdsStreamRequest")
+        request.customer_id = str(login_customer_id)
+        request.query = """
+            SELECT
+                customer_client.id,
+                customer_client.descriptive_name
+            FROM customer_client
+        """
+
+        names = {}
+        for batch in ga_service.search_stream(request=request):
+            for row in batch.results:
+                customer_client = row.customer_client
+                if customer_client.descriptive_name:
+                    names[str(customer_client.id)] = customer_client.descriptive_name
+        return names
+
+    except Exception as ex:
+        logger.error(f"Failed to list customer client names: {ex}")
+        return {}
+
+
 class AccountManager:
     """Manages Google Ads customer accounts."""
 
@@ -61,6 +61,7 @@ class GoogleAdsClientFactory:
         client_id: str,
         client_secret: str,
         login_customer_id: str | None = None,
+        use_proto_plus: bool = True,
     ):
         """Initialize Google Ads client factory.
 
@@ -70,12 +71,15 @@ class GoogleAdsClientFactory:
             client_id: OAuth client ID
             client_secret: OAuth client secret
             login_customer_id: MCC customer ID (digits only)
+            use_proto_plus: Wrap responses in proto-plus messages. Disable for
+                bulk report pulls to read raw protobuf fields directly.
         """
         self.developer_token = developer_token
         self.refresh_token = refresh_token
         self.client_id = client_id
         self.client_secret = client_secret
         self.login_customer_id = self._validate_customer_id(login_customer_id)
+        self.use_proto_plus = use_proto_plus
 
     def _validate_customer_id(self, customer_id: str | None) -> str | None:
         """Validate customer ID format (digits only)."""
@@ -105,7 +109,7 @@ class GoogleAdsClientFactory:
             "refresh_token": self.refresh_token,
             "client_id": self.client_id,
             "client_secret": self.client_secret,
-            "use_proto_plus": True,
+            "use_proto_plus": self.use_proto_plus,
             "http_proxy": None,  # Ensure no proxy interference
             "https_proxy": None,
         }
@@ -177,11 +181,15 @@ class GoogleAdsService:
             return False
 
 
-def create_client_from_env() -> GoogleAdsService:
+def create_client_from_env(use_proto_plus: bool = True) -> GoogleAdsService:
     """Create client from environment variables or return a mock client.
 
     If ADS_USE_MOCK=1, returns a minimal mock client so the app can run without
     Google Ads credentials or network access.
+
+    Args:
+        use_proto_plus: Passed through to the client factory; set False for
+            row-heavy GAQL exports.
     """
     import os
 
@@ -201,6 +209,7 @@ def create_client_from_env() -> GoogleAdsService:
                     client_id="mock",
                     client_secret="mock",
                     login_customer_id=os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID"),
+                    use_proto_plus=use_proto_plus,
                 )
 
             def create_client(self):
@@ -225,6 +234,7 @@ def create_client_from_env() -> GoogleAdsService:
         client_id=os.getenv("GOOGLE_ADS_CLIENT_ID", ""),
         client_secret=os.getenv("GOOGLE_ADS_CLIENT_SECRET", ""),
         login_customer_id=os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID"),
+        use_proto_plus=use_proto_plus,
     )
 
     return GoogleAdsService(factory)
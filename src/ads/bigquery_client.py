@@ -1,9 +1,12 @@
 """BigQuery client for Google Ads data warehouse."""
 
+import io
 import logging
 import os
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from google.cloud import bigquery
 from google.oauth2 import service_account
 
@@ -176,10 +179,49 @@ class BigQueryClient:
             logger.error(f"Failed to insert data into {table_name}: {ex}")
             raise
 
-    def query(self, sql: str) -> pd.DataFrame:
-        """Execute a SQL query and return results as DataFrame."""
+    def insert_arrow_table(self, table_name: str, table: pa.Table) -> None:
+        """Append a pyarrow Table to a BigQuery table via a Parquet load job.
+
+        The table is serialized to Parquet in memory and loaded with
+        ``load_table_from_file``, skipping the pandas round-trip that
+        ``insert_dataframe`` needs.
+        """
         try:
-            return self.client.query(sql).to_dataframe()
+            table_ref = self.dataset_ref.table(table_name)
+
+            buffer = io.BytesIO()
+            pq.write_table(table, buffer, compression="snappy")
+            buffer.seek(0)
+
+            job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.PARQUET,
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            )
+
+            job = self.client.load_table_from_file(
+                buffer, table_ref, job_config=job_config
+            )
+
+            job.result()  # Wait for job to complete
+            logger.info(f"Inserted {table.num_rows} rows into {table_name}")
+
+        except Exception as ex:
+            logger.error(f"Failed to insert data into {table_name}: {ex}")
+            raise
+
+    def query(
+        self, sql: str, job_config: bigquery.QueryJobConfig | None = None
+    ) -> pd.DataFrame:
+        """Execute a SQL query and return results as DataFrame.
+
+        Results are downloaded over the BigQuery Storage Read API (Arrow) when
+        google-cloud-bigquery-storage is installed, falling back to the REST
+        tabledata.list path otherwise.
+        """
+        try:
+            return self.client.query(sql, job_config=job_config).to_dataframe(
+                create_bqstorage_client=True
+            )
         except Exception as ex:
             logger.error(f"Query failed: {ex}")
             raise
@@ -211,7 +253,9 @@ class BigQueryClient:
             ]
         )
 
-        return self.client.query(sql, job_config=job_config).to_dataframe()
+        return self.client.query(sql, job_config=job_config).to_dataframe(
+            create_bqstorage_client=True
+        )
 
 
 def create_bigquery_client_from_env() -> BigQueryClient:
@@ -10,13 +10,42 @@ from ads.reporting import ReportingManager
 
 logger = logging.getLogger(__name__)
 
+# Required columns and the value used when a report omits them.
+CAMPAIGN_COLUMN_DEFAULTS = {
+    "date": "",
+    "customer_id": "",
+    "campaign_id": "",
+    "campaign_name": "",
+    "impressions": 0,
+    "clicks": 0,
+    "cost_micros": 0,
+    "conversions": 0.0,
+}
+KEYWORD_COLUMN_DEFAULTS = {
+    "date": "",
+    "customer_id": "",
+    "campaign_id": "",
+    "ad_group_id": "",
+    "criterion_id": "",
+    "keyword_text": "",
+    "impressions": 0,
+    "clicks": 0,
+    "cost_micros": 0,
+}
+
 
 class GoogleAdsETLPipeline:
     """ETL Pipeline for Google Ads to BigQuery."""
 
-    def __init__(self):
-        """Initialize ETL pipeline."""
+    def __init__(self, use_proto_plus: bool = True):
+        """Initialize ETL pipeline.
+
+        Args:
+            use_proto_plus: Build Google Ads clients with proto-plus wrappers.
+                Bulk syncs should pass False to iterate raw protobuf rows.
+        """
         self.bq_client = create_bigquery_client_from_env()
+        self.use_proto_plus = use_proto_plus
 
     def sync_campaign_data(self, customer_ids: list[str], days_back: int = 7) -> None:
         """Sync campaign performance data for multiple customers."""
@@ -33,7 +62,9 @@ class GoogleAdsETLPipeline:
                 logger.info(f"Processing customer: {customer_id}")
 
                 # Get campaign performance data
-                reporting_mgr = ReportingManager(customer_id)
+                reporting_mgr = ReportingManager(
+                    customer_id, use_proto_plus=self.use_proto_plus
+                )
                 campaign_df = reporting_mgr.export_campaign_performance(
                     start_date, end_date
                 )
@@ -74,7 +105,9 @@ class GoogleAdsETLPipeline:
                 logger.info(f"Processing customer: {customer_id}")
 
                 # Get keyword performance data
-                reporting_mgr = ReportingManager(customer_id)
+                reporting_mgr = ReportingManager(
+                    customer_id, use_proto_plus=self.use_proto_plus
+                )
                 keyword_df = reporting_mgr.export_keyword_performance(
                     start_date, end_date
                 )
@@ -102,9 +135,9 @@ class GoogleAdsETLPipeline:
 
     def _transform_campaign_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform campaign data for BigQuery."""
-        # Convert date column to proper format
+        # Keep dates as datetime64; BigQuery casts them to DATE on load
         if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
+            df["date"] = pd.to_datetime(df["date"]).dt.normalize()
 
         # Add updated_at timestamp
         df["updated_at"] = datetime.now()
@@ -115,34 +148,13 @@ class GoogleAdsETLPipeline:
         if "average_cpc" in df.columns:
             df["average_cpc_dollars"] = df["average_cpc"] / 1_000_000
 
-        # Ensure required columns are present
-        required_columns = [
-            "date",
-            "customer_id",
-            "campaign_id",
-            "campaign_name",
-            "impressions",
-            "clicks",
-            "cost_micros",
-            "conversions",
-        ]
-
-        for col in required_columns:
-            if col not in df.columns:
-                if col in ["impressions", "clicks", "cost_micros"]:
-                    df[col] = 0
-                elif col == "conversions":
-                    df[col] = 0.0
-                else:
-                    df[col] = ""
-
-        return df
+        return _with_defaults(df, CAMPAIGN_COLUMN_DEFAULTS)
 
     def _transform_keyword_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform keyword data for BigQuery."""
-        # Convert date column to proper format
+        # Keep dates as datetime64; BigQuery casts them to DATE on load
         if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
+            df["date"] = pd.to_datetime(df["date"]).dt.normalize()
 
         # Add updated_at timestamp
         df["updated_at"] = datetime.now()
@@ -153,29 +165,7 @@ class GoogleAdsETLPipeline:
         if "average_cpc" in df.columns:
             df["average_cpc_dollars"] = df["average_cpc"] / 1_000_000
 
-        # Ensure required columns are present
-        required_columns = [
-            "date",
-            "customer_id",
-            "campaign_id",
-            "ad_group_id",
-            "criterion_id",
-            "keyword_text",
-            "impressions",
-            "clicks",
-            "cost_micros",
-        ]
-
-        for col in required_columns:
-            if col not in df.columns:
-                if col in ["impressions", "clicks", "cost_micros", "quality_score"]:
-                    df[col] = 0
-                elif col == "conversions":
-                    df[col] = 0.0
-                else:
-                    df[col] = ""
-
-        return df
+        return _with_defaults(df, KEYWORD_COLUMN_DEFAULTS)
 
     def _load_to_bigquery(self, df: pd.DataFrame, table_name: str) -> None:
         """Load DataFrame to BigQuery table."""
@@ -204,13 +194,21 @@ class GoogleAdsETLPipeline:
             raise
 
 
+def _with_defaults(df: pd.DataFrame, defaults: dict) -> pd.DataFrame:
+    """Add any missing required columns, filled with their defaults, in one assign."""
+    missing = {col: value for col, value in defaults.items() if col not in df.columns}
+    return df.assign(**missing) if missing else df
+
+
 def run_daily_sync(customer_ids: list[str]) -> None:
     """Run daily data sync - typically called by scheduler."""
     pipeline = GoogleAdsETLPipeline()
     pipeline.full_sync(customer_ids, days_back=2)  # Get last 2 days to handle delays
 
 
-def backfill_data(customer_ids: list[str], days_back: int = 30) -> None:
+def backfill_data(
+    customer_ids: list[str], days_back: int = 30, use_proto_plus: bool = True
+) -> None:
     """Backfill historical data."""
-    pipeline = GoogleAdsETLPipeline()
+    pipeline = GoogleAdsETLPipeline(use_proto_plus=use_proto_plus)
     pipeline.full_sync(customer_ids, days_back=days_back)
@@ -15,10 +15,16 @@ logger = logging.getLogger(__name__)
 class ReportingManager:
     """Manages Google Ads reporting using GAQL SearchStream."""
 
-    def __init__(self, customer_id: str):
-        """Initialize with customer ID."""
+    def __init__(self, customer_id: str, use_proto_plus: bool = True):
+        """Initialize with customer ID.
+
+        Args:
+            customer_id: Google Ads customer ID
+            use_proto_plus: Set False to stream raw protobuf rows, which avoids
+                proto-plus wrapping on every field access in bulk exports.
+        """
         self.customer_id = customer_id
-        self.service = create_client_from_env()
+        self.service = create_client_from_env(use_proto_plus=use_proto_plus)
         self.client = self.service.client
 
     def get_campaign_performance(
@@ -111,6 +117,17 @@ class ReportingManager:
         try:
             ga_service = self.client.get_service("GoogleAdsService")
 
+            def _enum_name(message, field: str) -> str:
+                # proto-plus enums carry .name; raw protobuf enums are plain ints
+                value = getattr(message, field)
+                if hasattr(value, "name"):
+                    return value.name
+                try:
+                    enum_type = message.DESCRIPTOR.fields_by_name[field].enum_type
+                    return enum_type.values_by_number[value].name
+                except Exception:
+                    return str(value)
+
             def _row_to_dict(r):
                 if report_name == "campaign_performance":
                     return {
@@ -119,9 +136,7 @@ class ReportingManager:
                         "customer_name": str(r.customer.descriptive_name),
                         "campaign_id": str(r.campaign.id),
                         "campaign_name": str(r.campaign.name),
-                        "campaign_status": r.campaign.status.name
-                        if hasattr(r.campaign.status, "name")
-                        else str(r.campaign.status),
+                        "campaign_status": _enum_name(r.campaign, "status"),
                         "impressions": int(r.metrics.impressions),
                         "clicks": int(r.metrics.clicks),
                         "cost_micros": int(r.metrics.cost_micros),
@@ -143,9 +158,9 @@ class ReportingManager:
                         "ad_group_id": str(r.ad_group.id),
                         "criterion_id": str(r.ad_group_criterion.criterion_id),
                         "keyword_text": str(r.ad_group_criterion.keyword.text),
-                        "match_type": r.ad_group_criterion.keyword.match_type.name
-                        if hasattr(r.ad_group_criterion.keyword.match_type, "name")
-                        else str(r.ad_group_criterion.keyword.match_type),
+                        "match_type": _enum_name(
+                            r.ad_group_criterion.keyword, "match_type"
+                        ),
                         "quality_score": int(
                             getattr(
                                 r.ad_group_criterion.quality_info, "quality_score", 0
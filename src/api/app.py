@@ -1,6 +1,8 @@
 """Main FastAPI application - unified ads platform with agent orchestration."""
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -28,6 +30,10 @@ static_dir = str(BASE_DIR / "static")
 
 logger = logging.getLogger(__name__)
 
+# Threads behind asyncio.to_thread; Google Ads discovery runs up to
+# DISCOVERY_CONCURRENCY blocking gRPC calls alongside other providers.
+BLOCKING_IO_WORKERS = int(os.getenv("BLOCKING_IO_WORKERS", "32"))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -41,6 +47,11 @@ async def lifespan(app: FastAPI):
     logger.info(f"🔧 HOST: {os.getenv('HOST', 'not set')}")
     logger.info(f"🔧 DATABASE_URL: {'set' if os.getenv('DATABASE_URL') else 'not set'}")
     
+    # The default pool is sized min(32, cpus + 4), too small on slim containers
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_IO_WORKERS, thread_name_prefix="blocking-io")
+    )
+    
     # Import agents to register them (safe operation)
     try:
         from ..agents import ingestors, transforms, activations, decisions
@@ -63,6 +74,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("⏹️ Shutting down AI AdWords platform")
+    
+    from ..integrations.http_session import close_shared_session
+    await close_shared_session()
 
 
 # Create FastAPI application
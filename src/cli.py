@@ -7,6 +7,13 @@ from src.ads.accounts import list_accessible_clients
 
 app = typer.Typer(help="AI AdWords - Google Ads management CLI")
 
+# sync-data --data-type -> GoogleAdsETLPipeline method
+_SYNC_DISPATCH = {
+    "all": "full_sync",
+    "campaigns": "sync_campaign_data",
+    "keywords": "sync_keyword_data",
+}
+
 
 @app.command("accounts")
 def accounts() -> None:
@@ -85,27 +92,26 @@ def sync_data(
     customer_ids: str = typer.Option(..., help="Comma-separated customer IDs"),
     days_back: int = typer.Option(7, help="Number of days to sync"),
     data_type: str = typer.Option("all", help="Data type: all, campaigns, keywords"),
+    fast_protos: bool = typer.Option(
+        True, help="Read raw protobuf rows (use_proto_plus=False) for bulk pulls"
+    ),
 ) -> None:
     """Sync Google Ads data to BigQuery."""
     from src.ads.etl_pipeline import GoogleAdsETLPipeline
 
     try:
         customer_list = [cid.strip() for cid in customer_ids.split(",")]
-        pipeline = GoogleAdsETLPipeline()
+        pipeline = GoogleAdsETLPipeline(use_proto_plus=not fast_protos)
 
         print(f"Starting sync for {len(customer_list)} customers...")
         print(f"Date range: Last {days_back} days")
         print(f"Data type: {data_type}")
 
-        if data_type == "all":
-            pipeline.full_sync(customer_list, days_back)
-        elif data_type == "campaigns":
-            pipeline.sync_campaign_data(customer_list, days_back)
-        elif data_type == "keywords":
-            pipeline.sync_keyword_data(customer_list, days_back)
-        else:
+        method_name = _SYNC_DISPATCH.get(data_type)
+        if not method_name:
             print(f"Unknown data type: {data_type}")
             return
+        getattr(pipeline, method_name)(customer_list, days_back)
 
         print("✅ Data sync completed successfully!")
 
@@ -117,6 +123,9 @@ def sync_data(
 def backfill(
     customer_ids: str = typer.Option(..., help="Comma-separated customer IDs"),
     days_back: int = typer.Option(30, help="Number of days to backfill"),
+    fast_protos: bool = typer.Option(
+        True, help="Read raw protobuf rows (use_proto_plus=False) for bulk pulls"
+    ),
 ) -> None:
     """Backfill historical Google Ads data to BigQuery."""
     from src.ads.etl_pipeline import backfill_data
@@ -127,7 +136,7 @@ def backfill(
         print(f"Starting backfill for {len(customer_list)} customers...")
         print(f"Backfilling last {days_back} days...")
 
-        backfill_data(customer_list, days_back)
+        backfill_data(customer_list, days_back, use_proto_plus=not fast_protos)
 
         print("✅ Backfill completed successfully!")
 
@@ -11,8 +11,6 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from .agents.runner import agent_registry, AgentRunner
-
 app = typer.Typer(help="AI AdWords Agent Management CLI")
 console = Console()
 logger = logging.getLogger(__name__)
@@ -21,6 +19,8 @@ logger = logging.getLogger(__name__)
 @app.command("list")
 def list_agents():
     """List all available agents."""
+    from .agents.runner import agent_registry
+
     try:
         agents = agent_registry.list_agents()
         
@@ -65,6 +65,8 @@ def run_agent(
     params: Optional[str] = typer.Option(None, "--params", help="JSON parameters"),
 ):
     """Run a specific agent job."""
+    from .agents.runner import AgentRunner, agent_registry
+
     try:
         # Validate agent exists
         if agent_name not in agent_registry.list_agents():
@@ -252,7 +254,8 @@ async def run_agent_async(
     params: Optional[dict] = None,
 ):
     """Async helper for running agents."""
-    
+    from .agents.runner import AgentRunner, agent_registry
+
     window = None
     if start_date or end_date:
         window = {}
@@ -275,6 +278,8 @@ async def run_agent_async(
 @app.command("demo")
 def demo_workflow():
     """Run a demo workflow showing agent orchestration."""
+    from .agents.runner import AgentRunner, agent_registry
+
     try:
         console.print("🎬 Running Agent Demo Workflow", style="bold yellow")
         console.print("This demonstrates the agent orchestration system\n")
@@ -1,166 +1,560 @@
-"""Modern web dashboard for multi-platform advertising analytics."""
+"""Modern web dashboard for multi-platform advertising analytics.
 
+Responses are compressed in-process (Brotli when brotli-asgi is installed,
+gzip otherwise), except the NDJSON /api/timeseries stream. uvicorn only
+speaks HTTP/1.1, so in production run it behind a reverse proxy that
+terminates TLS and HTTP/2 for multiplexed fetches, e.g. Caddy::
+
+    dashboard.example.com {
+        reverse_proxy 127.0.0.1:8080
+    }
+
+or nginx::
+
+    server {
+        listen 443 ssl http2;
+        location / {
+            proxy_pass http://127.0.0.1:8080;
+            proxy_buffering off;  # keep /api/timeseries streaming
+        }
+    }
+"""
+
+import asyncio
+import hashlib
+import html
 import logging
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from string import Template
+from types import MappingProxyType
+
+import msgspec
+import orjson
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    make_asgi_app,
+    multiprocess,
+)
 import os
-import sys
-
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+from ..integrations.helpers import single_flight
 from ..services.bigquery_service import get_bigquery_service
 
 logger = logging.getLogger(__name__)
 
+try:
+    from fastapi_cache import FastAPICache
+    from fastapi_cache.backends.inmemory import InMemoryBackend
+    from fastapi_cache.backends.redis import RedisBackend
+    from fastapi_cache.decorator import cache
+    from redis import asyncio as aioredis
+    FASTAPI_CACHE_AVAILABLE = True
+except ImportError:
+    FASTAPI_CACHE_AVAILABLE = False
+    logger.warning("fastapi-cache2 not available, dashboard responses are not cached")
+
+    def cache(*args, **kwargs):
+        """No-op stand-in for fastapi_cache.decorator.cache."""
+        return lambda func: func
+
+try:
+    from brotli_asgi import BrotliMiddleware
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+    logger.warning("brotli-asgi not available, falling back to gzip compression")
+
+# Dashboard data is refreshed hourly at best
+DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", "3600"))
+# Per-worker L1 in front of the shared cache, to skip the Redis round-trip
+DASHBOARD_L1_TTL = int(os.getenv("DASH_L1_TTL", "60"))
+
+# Query latency and cache effectiveness, for tuning the TTLs above
+BQ_QUERY_SECONDS = Histogram(
+    "dashboard_bq_query_seconds", "BigQuery query latency", ["kind"]
+)
+CACHE_LOOKUPS = Counter(
+    "dashboard_cache_lookups_total", "Dashboard cache lookups", ["layer", "result"]
+)
+
+# Set when fetch_dashboard_data runs, so a caller of the shared cache can tell
+# a miss from a hit
+_fetched_from_bigquery: ContextVar[bool] = ContextVar(
+    "_fetched_from_bigquery", default=False
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure the response cache (Redis when REDIS_URL is set) and render page shells."""
+    if FASTAPI_CACHE_AVAILABLE:
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            backend = RedisBackend(aioredis.from_url(redis_url))
+            logger.info("Dashboard cache: Redis")
+        else:
+            backend = InMemoryBackend()
+            logger.info("Dashboard cache: in-memory (set REDIS_URL for Redis)")
+        FastAPICache.init(backend, prefix="synter")
+
+    # Page HTML no longer depends on the data, so render it once per start
+    _render_shells()
+
+    # Connect to BigQuery in the background so the worker starts serving
+    # immediately; the first data request waits on the same init lock.
+    init_task = asyncio.create_task(dashboard._ensure_inited())
+    yield
+    init_task.cancel()
+
+
 # Create FastAPI app for dashboard
-dashboard_app = FastAPI(title="Synter Analytics Dashboard", version="1.0.0")
+dashboard_app = FastAPI(
+    title="Synter Analytics Dashboard", version="1.0.0", lifespan=lifespan
+)
+
+# NDJSON streams are sent uncompressed: the compressors buffer their output,
+# which would deliver the whole stream in one burst
+_UNCOMPRESSED_PATHS = frozenset({"/api/timeseries"})
+
+
+class _CompressionMiddleware:
+    """Compress responses except for the streaming routes above."""
+
+    def __init__(self, app):
+        self.app = app
+        # Compress HTML/JSON above ~0.5 KB; Brotli still serves gzip to older clients
+        if BROTLI_AVAILABLE:
+            self.compressed_app = BrotliMiddleware(app, quality=4, minimum_size=512)
+        else:
+            self.compressed_app = GZipMiddleware(app, minimum_size=512, compresslevel=5)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in _UNCOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+        else:
+            await self.compressed_app(scope, receive, send)
 
-# Setup templates
-templates_dir = os.path.join(os.path.dirname(__file__), "templates")
-if not os.path.exists(templates_dir):
-    os.makedirs(templates_dir)
 
-templates = Jinja2Templates(directory=templates_dir)
+dashboard_app.add_middleware(_CompressionMiddleware)
+
+# Page shells are string.Template files with $title and $data_json
+# placeholders; literal dollar signs are written as $$.
+templates_dir = os.path.join(os.path.dirname(__file__), "templates")
+os.makedirs(templates_dir, exist_ok=True)
 
 # Setup static files
 static_dir = os.path.join(os.path.dirname(__file__), "static")
-if not os.path.exists(static_dir):
-    os.makedirs(static_dir)
+os.makedirs(static_dir, exist_ok=True)
 
 dashboard_app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 
+def _metrics_app():
+    """Prometheus exposition app, aggregating across workers when configured."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return make_asgi_app(registry=registry)
+    return make_asgi_app()
+
+
+dashboard_app.mount("/metrics", _metrics_app())
+
+
+# Demo payload served when BigQuery is not available. Read-only and shared, with
+# its JSON encoding computed once for the degraded /api/data path.
+_DEMO_DATA = MappingProxyType({
+    "kpis": {
+        "total_spend": 23528.84,
+        "total_impressions": 150000,
+        "total_clicks": 14562,
+        "total_conversions": 790,
+        "avg_ctr": 9.7,
+        "avg_cpc": 1.62,
+        "avg_roas": 3.2
+    },
+    "platforms": [
+        {
+            "name": "Microsoft Ads",
+            "spend": 10082.49,
+            "clicks": 7153,
+            "conversions": 382,
+            "cpa": 26.39,
+            "status": "Active"
+        },
+        {
+            "name": "LinkedIn Ads", 
+            "spend": 7960.00,
+            "clicks": 3480,
+            "conversions": 185,
+            "cpa": 43.03,
+            "status": "Active"
+        },
+        {
+            "name": "Reddit Ads",
+            "spend": 5486.35,
+            "clicks": 3929,
+            "conversions": 223,
+            "cpa": 24.60,
+            "status": "Active"
+        }
+    ],
+    "time_series": {},
+    "connected": False,
+    "last_updated": "Demo data"
+})
+
+
+class KpiChanges(msgspec.Struct):
+    """Period-over-period change, in percent."""
+
+    spend: float = 0.0
+    impressions: float = 0.0
+    clicks: float = 0.0
+    conversions: float = 0.0
+    ctr: float = 0.0
+    roas: float = 0.0
+
+
+class Kpis(msgspec.Struct):
+    """Headline KPI cards. UNSET fields are left out of the JSON."""
+
+    total_spend: float = 0.0
+    total_impressions: int = 0
+    total_clicks: int = 0
+    total_conversions: int = 0
+    avg_ctr: float = 0.0
+    avg_roas: float = 0.0
+    avg_cpc: float | msgspec.UnsetType = msgspec.UNSET
+    changes: KpiChanges | msgspec.UnsetType = msgspec.UNSET
+
+
+class Platform(msgspec.Struct):
+    """One advertising platform in the breakdown."""
+
+    name: str
+    spend: float = 0.0
+    clicks: int = 0
+    conversions: int = 0
+    status: str = ""
+    platform: str | msgspec.UnsetType = msgspec.UNSET
+    impressions: int | msgspec.UnsetType = msgspec.UNSET
+    ctr: float | msgspec.UnsetType = msgspec.UNSET
+    roas: float | msgspec.UnsetType = msgspec.UNSET
+    cpa: float | msgspec.UnsetType = msgspec.UNSET
+
+
+class TimeSeries(msgspec.Struct):
+    """Daily chart series, one list per field."""
+
+    date: list[str] = msgspec.field(default_factory=list)
+    spend: list[float] = msgspec.field(default_factory=list)
+    impressions: list[int] = msgspec.field(default_factory=list)
+    clicks: list[int] = msgspec.field(default_factory=list)
+    conversions: list[int] = msgspec.field(default_factory=list)
+
+
+class DashboardPayload(msgspec.Struct):
+    """Schema of the /api/data response."""
+
+    kpis: Kpis
+    platforms: list[Platform]
+    time_series: TimeSeries
+    connected: bool
+    last_updated: str
+
+
+def _encode_payload(data) -> bytes:
+    """Validate a dashboard data dict against DashboardPayload and encode it."""
+    return msgspec.json.encode(msgspec.convert(data, DashboardPayload))
+
+
+_DEMO_DATA_JSON = _encode_payload(dict(_DEMO_DATA))
+
+
+# Static page shells: template -> page title. The pages are rendered once with
+# the demo payload and hydrated in the browser from /api/kpis and /api/timeseries.
+_SHELL_PAGES = {
+    "dashboard.html": "Synter Analytics Dashboard",
+    "platforms.html": "Platform Performance",
+}
+
+
+def _shell_path(template_name: str) -> str:
+    """Location of the pre-rendered shell for a template under static/."""
+    stem, _ = os.path.splitext(template_name)
+    return os.path.join(static_dir, f"{stem}_shell.html")
+
+
+def _render_shells() -> None:
+    """Render each page template into a static HTML shell."""
+    # Embedded in a <script>, so keep "</" from closing the tag early
+    data_json = _DEMO_DATA_JSON.decode().replace("</", "<\\/")
+
+    for template_name, title in _SHELL_PAGES.items():
+        template_path = os.path.join(templates_dir, template_name)
+        if not os.path.exists(template_path):
+            logger.warning(f"Template {template_name} not found, page disabled")
+            continue
+
+        with open(template_path, encoding="utf-8") as f:
+            template = Template(f.read())
+        page = template.substitute(title=html.escape(title), data_json=data_json)
+        # Write then rename so concurrently starting workers never serve a
+        # half-written file
+        path = _shell_path(template_name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(page)
+        os.replace(tmp_path, path)
+
+
+def _shell_response(template_name: str) -> FileResponse:
+    """Serve a pre-rendered page shell."""
+    path = _shell_path(template_name)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Page not available")
+    return FileResponse(path, media_type="text/html")
+
+
 class SynterDashboard:
     """Main dashboard class for multi-platform advertising analytics."""
 
     def __init__(self):
-        """Initialize dashboard with BigQuery connection."""
-        try:
-            self.bq_service = get_bigquery_service()
-            self.connected = self.bq_service.is_available()
-        except Exception as e:
-            logger.error(f"Failed to initialize BigQuery service: {e}")
-            self.bq_service = None
-            self.connected = False
+        """Initialize dashboard; the BigQuery connection is made on first use."""
+        self.bq_service = None
+        self.connected: bool | None = None  # None until _ensure_inited runs
+        self._init_lock = asyncio.Lock()
+
+        self._l1 = TTLCache(maxsize=32, ttl=DASHBOARD_L1_TTL)
+        self._inflight: dict[int, asyncio.Future] = {}
+
+    async def _ensure_inited(self) -> None:
+        """Connect to BigQuery once, running the blocking auth in a thread."""
+        if self.connected is not None:
+            return
+
+        async with self._init_lock:
+            if self.connected is not None:
+                return
+            try:
+                self.bq_service = await asyncio.to_thread(get_bigquery_service)
+                self.connected = self.bq_service.is_available()
+            except Exception as e:
+                logger.error(f"Failed to initialize BigQuery service: {e}")
+                self.bq_service = None
+                self.connected = False
 
     async def get_dashboard_data(self, days: int = 30):
         """Get comprehensive dashboard data from BigQuery."""
+        await self._ensure_inited()
         if not self.connected:
             return self._get_demo_data()
 
         try:
-            # Get KPI summary
-            kpi_data = await self.bq_service.get_kpi_summary(days)
-            
-            # Get platform performance
-            platform_data = await self.bq_service.get_platform_performance(days)
-            
-            # Get time series data for charts
-            time_series_data = await self.bq_service.get_time_series(days)
-            
-            return {
-                "kpis": kpi_data or {},
-                "platforms": platform_data or [],
-                "time_series": time_series_data or [],
-                "connected": True,
-                "last_updated": "Just now"
-            }
-            
+            return await self.get_cached_data(days)
         except Exception as e:
             logger.error(f"Error fetching dashboard data: {e}")
             return self._get_demo_data()
 
-    def _get_demo_data(self):
-        """Return demo data when BigQuery is not available."""
+    async def get_cached_data(self, days: int = 30) -> dict:
+        """Dashboard payload from the caches, raising if BigQuery fails."""
+        data = self._l1.get(days)
+        if data is not None:
+            CACHE_LOOKUPS.labels("l1", "hit").inc()
+            return data
+        CACHE_LOOKUPS.labels("l1", "miss").inc()
+
+        # Concurrent misses for a window share one fetch
+        return await single_flight(
+            self._inflight, days, lambda: self._load_into_l1(days)
+        )
+
+    async def _load_into_l1(self, days: int) -> dict:
+        """Fetch through the shared cache and populate the L1."""
+        _fetched_from_bigquery.set(False)
+        data = await _cached_dashboard_data(days=days)
+        result = "miss" if _fetched_from_bigquery.get() else "hit"
+        CACHE_LOOKUPS.labels("shared", result).inc()
+        self._l1[days] = data
+        return data
+
+    async def fetch_dashboard_data(self, days: int = 30) -> dict:
+        """Query BigQuery for the dashboard payload, bypassing the cache.
+
+        Query errors propagate so that neither cache layer stores a failed
+        load; get_dashboard_data falls back to demo data instead.
+        """
+        _fetched_from_bigquery.set(True)
+        # KPI summary, platform breakdown and chart series in one BigQuery job
+        with BQ_QUERY_SECONDS.labels("bundle").time():
+            kpi_data, platform_data, time_series_data = (
+                await self.bq_service.get_dashboard_bundle(days)
+            )
+
         return {
-            "kpis": {
-                "total_spend": 23528.84,
-                "total_impressions": 150000,
-                "total_clicks": 14562,
-                "total_conversions": 790,
-                "avg_ctr": 9.7,
-                "avg_cpc": 1.62,
-                "avg_roas": 3.2
-            },
-            "platforms": [
-                {
-                    "name": "Microsoft Ads",
-                    "spend": 10082.49,
-                    "clicks": 7153,
-                    "conversions": 382,
-                    "cpa": 26.39,
-                    "status": "Active"
-                },
-                {
-                    "name": "LinkedIn Ads", 
-                    "spend": 7960.00,
-                    "clicks": 3480,
-                    "conversions": 185,
-                    "cpa": 43.03,
-                    "status": "Active"
-                },
-                {
-                    "name": "Reddit Ads",
-                    "spend": 5486.35,
-                    "clicks": 3929,
-                    "conversions": 223,
-                    "cpa": 24.60,
-                    "status": "Active"
-                }
-            ],
-            "time_series": [],
-            "connected": False,
-            "last_updated": "Demo data"
+            "kpis": kpi_data or {},
+            "platforms": platform_data or [],
+            "time_series": time_series_data or {},
+            "connected": True,
+            "last_updated": "Just now"
         }
 
+    def _get_demo_data(self):
+        """Return demo data when BigQuery is not available."""
+        return _DEMO_DATA
+
+
+def _dashboard_cache_key(func, namespace: str = "", *, request=None, response=None,
+                         args=(), kwargs=None) -> str:
+    """Cache key depends only on the lookback window."""
+    days = (kwargs or {}).get("days", 30)
+    return f"{namespace}:dash:{days}"
+
+
+@cache(expire=DASHBOARD_CACHE_TTL, namespace="dashboard",
+       key_builder=_dashboard_cache_key)
+async def _cached_dashboard_data(days: int = 30) -> dict:
+    """Dashboard payload shared by the HTML and JSON routes.
+
+    Only the data dict is cached, never a rendered response.
+    """
+    return await dashboard.fetch_dashboard_data(days)
+
 
 # Initialize dashboard
 dashboard = SynterDashboard()
 
 
 @dashboard_app.get("/", response_class=HTMLResponse)
-async def dashboard_home(request: Request):
-    """Main dashboard page."""
-    data = await dashboard.get_dashboard_data()
-    
-    return templates.TemplateResponse("dashboard.html", {
-        "request": request,
-        "data": data,
-        "title": "Synter Analytics Dashboard"
-    })
+async def dashboard_home():
+    """Main dashboard page (static shell; data is fetched by the page)."""
+    return _shell_response("dashboard.html")
 
 
-@dashboard_app.get("/api/data")
-async def get_dashboard_api_data(days: int = 30):
-    """API endpoint for dashboard data."""
-    return await dashboard.get_dashboard_data(days)
+@dashboard_app.get("/api/data", response_class=ORJSONResponse)
+async def get_dashboard_api_data(request: Request, days: int = 30):
+    """API endpoint for dashboard data.
 
+    Sends a weak ETag over the encoded payload so polling clients get a
+    304 while the cached data is unchanged.
+    """
+    data = await dashboard.get_dashboard_data(days)
+    body = _DEMO_DATA_JSON
+    if data is not _DEMO_DATA:
+        try:
+            body = _encode_payload(data)
+        except msgspec.ValidationError as e:
+            logger.error(f"Invalid dashboard payload, serving demo data: {e}")
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
-@dashboard_app.get("/platforms")
-async def platforms_page(request: Request):
-    """Platform-specific dashboard page."""
-    data = await dashboard.get_dashboard_data()
-    
-    return templates.TemplateResponse("platforms.html", {
-        "request": request,
-        "data": data,
-        "title": "Platform Performance"
+
+@dashboard_app.get("/api/kpis", response_class=ORJSONResponse)
+async def get_kpis_api_data(days: int = 30):
+    """KPI cards and platform breakdown without the time series.
+
+    Small enough to cache for longer than /api/data; the chart series is
+    served separately by /api/timeseries.
+    """
+    data = await dashboard.get_dashboard_data(days)
+    body = orjson.dumps({
+        "kpis": data["kpis"],
+        "platforms": data["platforms"],
+        "connected": data["connected"],
+        "last_updated": data["last_updated"],
     })
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
+
+
+@dashboard_app.get("/api/timeseries")
+async def get_timeseries_api_data(days: int = 30):
+    """Daily time series as NDJSON, one point per line.
+
+    Points come from the same cached payload as /api/data, so the chart
+    never runs its own BigQuery job. Empty when BigQuery is not connected;
+    a failed load is a 503 rather than an empty stream.
+    """
+    await dashboard._ensure_inited()
+    series = {}
+    if dashboard.connected:
+        try:
+            series = (await dashboard.get_cached_data(days))["time_series"]
+        except Exception as e:
+            logger.error(f"Error fetching time series: {e}")
+            raise HTTPException(status_code=503, detail="Time series unavailable")
+
+    def ndjson_rows():
+        fields = list(series)
+        for values in zip(*(series[field] for field in fields)):
+            yield orjson.dumps(dict(zip(fields, values))) + b"\n"
+
+    return StreamingResponse(ndjson_rows(), media_type="application/x-ndjson")
+
+
+@dashboard_app.get("/platforms", response_class=HTMLResponse)
+async def platforms_page():
+    """Platform-specific dashboard page (static shell)."""
+    return _shell_response("platforms.html")
+
+
+# Orchestrators may probe /health many times a second
+HEALTH_TTL = 5.0
+_health_cache: list = [0.0, None]  # [monotonic timestamp, response body]
 
 
 @dashboard_app.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    return {
+    """Health check endpoint, memoized for HEALTH_TTL seconds."""
+    now = time.monotonic()
+    if now - _health_cache[0] < HEALTH_TTL:
+        return _health_cache[1]
+
+    body = {
         "status": "healthy",
-        "bigquery_connected": dashboard.connected,
+        "bigquery_connected": bool(dashboard.connected),
         "service": "Synter Analytics Dashboard"
     }
+    _health_cache[:] = [now, body]
+    return body
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(dashboard_app, host="0.0.0.0", port=8080)
+
+    # Run as `python -m src.dashboard.app`; the import-string form is required
+    # for workers > 1. "auto" picks uvloop/httptools (uvicorn[standard]).
+    uvicorn.run(
+        "src.dashboard.app:dashboard_app",
+        host="0.0.0.0",
+        port=8080,
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+        access_log=False,
+        log_level="warning",
+    )
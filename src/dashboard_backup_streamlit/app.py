@@ -2,27 +2,88 @@
 Streamlit dashboard for Google Ads performance analytics.
 """
 
+import functools
+import hashlib
+import importlib
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import pyarrow.parquet as pq
 import streamlit as st
+from google.cloud import bigquery
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 try:
-    from ads.accounts import get_customer_info, list_accessible_clients
+    from ads.accounts import (
+        get_customer_client_names,
+        get_customer_info,
+        list_accessible_clients,
+    )
     from ads.bigquery_client import create_bigquery_client_from_env
     from ads.conversion_validator import create_validator_from_env
+    from ads.keywords import list_keywords
 except ImportError:
     # For Streamlit Cloud deployment
     sys.path.append("/app/src")
-    from ads.accounts import get_customer_info, list_accessible_clients
+    from ads.accounts import (
+        get_customer_client_names,
+        get_customer_info,
+        list_accessible_clients,
+    )
     from ads.bigquery_client import create_bigquery_client_from_env
     from ads.conversion_validator import create_validator_from_env
+    from ads.keywords import list_keywords
+
+# Row count per chunk when streaming the /tmp dashboard cache CSVs.
+CSV_CHUNK_ROWS = 100_000
+
+# Explicit dtypes for the campaign cache CSVs so pandas skips type inference.
+CAMPAIGN_CACHE_DTYPES = {
+    "customer_id": "string",
+    "campaign_id": "string",
+    "campaign_name": "string",
+    "status": "string",
+    "impressions": "int64",
+    "clicks": "int64",
+    "cost": "float64",
+    "conversions": "float64",
+    "ctr": "float64",
+    "cpc": "float64",
+    "conversion_rate": "float64",
+}
+
+# Columns the dashboard reads from campaign caches; the rest stay on disk.
+CAMPAIGN_COLUMNS = ["date", *CAMPAIGN_CACHE_DTYPES]
+
+# On-disk Parquet copies of BigQuery results. They outlive st.cache_data when
+# the container restarts; the TTL matches the in-memory caches.
+BQ_DISK_CACHE_DIR = "/tmp/bqcache"
+BQ_DISK_CACHE_TTL = 600
+
+# Keyword columns the dashboard uses. Older caches name the keyword column
+# "keyword" rather than "keyword_text", so both are read.
+KEYWORD_COLUMNS = [
+    "date",
+    "customer_id",
+    "campaign_name",
+    "keyword",
+    "keyword_text",
+    "impressions",
+    "clicks",
+    "cost",
+    "conversions",
+    "quality_score",
+]
 
 
 class GoogleAdsDashboard:
@@ -33,56 +94,102 @@ class GoogleAdsDashboard:
             self.bq_client = create_bigquery_client_from_env()
         except Exception:
             self.bq_client = None  # Will use demo data instead
-        self._accounts_cache = None
+
+    def _query_cached(
+        self, query: str, job_config: bigquery.QueryJobConfig | None = None
+    ) -> pd.DataFrame:
+        """Run a BigQuery query through a Parquet cache keyed on SQL and params."""
+        params = job_config.query_parameters if job_config else []
+        key = hashlib.sha1(
+            repr((query, [(p.name, p.type_, p.value) for p in params])).encode()
+        ).hexdigest()
+        path = os.path.join(BQ_DISK_CACHE_DIR, f"{key}.parquet")
+        if (
+            os.path.exists(path)
+            and time.time() - os.path.getmtime(path) < BQ_DISK_CACHE_TTL
+        ):
+            return pd.read_parquet(path)
+
+        df = self.bq_client.query(query, job_config)
+        try:
+            os.makedirs(BQ_DISK_CACHE_DIR, exist_ok=True)
+            df.to_parquet(f"{path}.tmp", index=False)
+            os.replace(f"{path}.tmp", path)
+        except (OSError, ValueError):
+            pass  # Caching is best-effort; the result is still returned
+        return df
 
     def get_accessible_accounts(self, refresh: bool = False) -> dict[str, str]:
+        """Get accessible Google Ads accounts, cached for the server process.
+
+        API failures fall back to demo accounts for this rerun only; the
+        fallback is never cached, so the next rerun tries the API again.
+        """
+        if refresh:
+            _get_accounts_cached.clear()
+            _get_customer_infos.clear()
+        try:
+            return _get_accounts_cached()
+        except Exception as e:
+            st.warning(f"Using demo mode due to API connection issue: {e}")
+            # Fallback to demo accounts
+            return {
+                "9639990200": "Sourcegraph (Demo)",
+                "1234567890": "Demo Account 1",
+            }
+
+    def _fetch_accessible_accounts(self) -> dict[str, str]:
         """Get accessible Google Ads accounts with their names."""
-        if self._accounts_cache is None or refresh:
-            try:
-                # Use demo accounts if in demo mode
-                if os.getenv("ADS_USE_DEMO") == "1" or os.getenv("ADS_USE_MOCK") == "1":
-                    self._accounts_cache = {
-                        "9639990200": "Sourcegraph",
-                        "1234567890": "Demo Account 1",
-                    }
-                    return self._accounts_cache
-
-                account_ids = list_accessible_clients()
-                accounts = {}
-                for account_id in account_ids:
-                    info = get_customer_info(account_id)
-                    if info and info.get("name"):
-                        name = info["name"]
-                    else:
-                        # Fallback names for known accounts
-                        if account_id == "9639990200":
-                            name = "Sourcegraph"
-                        else:
-                            name = f"Account {account_id}"
-                    accounts[account_id] = name
-                self._accounts_cache = accounts
-            except Exception as e:
-                st.warning(f"Using demo mode due to API connection issue: {e}")
-                # Fallback to demo accounts
-                self._accounts_cache = {
-                    "9639990200": "Sourcegraph (Demo)",
-                    "1234567890": "Demo Account 1",
-                }
-        return self._accounts_cache
+        # Use demo accounts if in demo mode
+        if os.getenv("ADS_USE_DEMO") == "1" or os.getenv("ADS_USE_MOCK") == "1":
+            return {
+                "9639990200": "Sourcegraph",
+                "1234567890": "Demo Account 1",
+            }
+
+        account_ids = list_accessible_clients()
+        # One customer_client query names every account under the MCC;
+        # only accounts it does not cover need a per-account lookup
+        names = get_customer_client_names()
+        missing = tuple(acc_id for acc_id in account_ids if acc_id not in names)
+        infos = _get_customer_infos(missing) if missing else {}
+        accounts = {}
+        for account_id in account_ids:
+            info = infos.get(account_id)
+            if account_id in names:
+                name = names[account_id]
+            elif info and info.get("name"):
+                name = info["name"]
+            else:
+                # Fallback names for known accounts
+                if account_id == "9639990200":
+                    name = "Sourcegraph"
+                else:
+                    name = f"Account {account_id}"
+            accounts[account_id] = name
+        return accounts
 
     def load_campaign_data(
         self, days_back: int = 30, customer_id: str = None
+    ) -> pd.DataFrame:
+        """Load campaign performance data, cached across reruns."""
+        return _load_campaign_cached(days_back, customer_id)
+
+    def _fetch_campaign_data(
+        self, days_back: int = 30, customer_id: str = None
     ) -> pd.DataFrame:
         """Load campaign performance data from realistic sample or BigQuery."""
         # Check for real Sourcegraph data first
         if customer_id == "9639990200":
             real_data_file = "sourcegraph_realistic_sample.csv"
-            if os.path.exists(real_data_file):
-                df = pd.read_csv(real_data_file)
+            df = _read_cached_table(
+                real_data_file, columns=CAMPAIGN_COLUMNS, parse_dates=["date"]
+            )
+            if df is not None:
                 st.info(
                     "📊 Using realistic Sourcegraph data based on actual account patterns"
                 )
-                return df
+                return _downcast(df)
 
         # Always use direct API for demo mode or if BigQuery is unavailable
         if customer_id or self.bq_client is None:
@@ -114,23 +221,103 @@ class GoogleAdsDashboard:
             ORDER BY date DESC, campaign_name
             """
 
-            return self.bq_client.query(query)
+            return self._query_cached(query)
         except Exception:
             # Fallback to direct API for any account if BigQuery fails
             if customer_id:
                 return self._load_direct_campaign_data(customer_id, days_back)
             return pd.DataFrame()
 
+    def load_campaign_daily(
+        self, days_back: int = 30, customer_id: str = None, campaign: str = None
+    ) -> pd.DataFrame:
+        """Load daily campaign totals, cached across reruns."""
+        return _load_campaign_daily_cached(days_back, customer_id, campaign)
+
+    def load_campaign_summary(
+        self, days_back: int = 30, customer_id: str = None
+    ) -> pd.DataFrame:
+        """Load per-campaign totals, cached across reruns."""
+        return _load_campaign_summary_cached(days_back, customer_id)
+
+    def _rollup_job_config(
+        self, days_back: int, campaign: str = None
+    ) -> tuple[str, bigquery.QueryJobConfig]:
+        """WHERE clause and parameters shared by the rollup queries."""
+        where_clause = (
+            "WHERE date >= DATE_SUB(CURRENT_DATE(), INTERVAL @days_back DAY)"
+        )
+        params = [bigquery.ScalarQueryParameter("days_back", "INT64", days_back)]
+        if campaign:
+            where_clause += " AND campaign_name = @campaign"
+            params.append(bigquery.ScalarQueryParameter("campaign", "STRING", campaign))
+        return where_clause, bigquery.QueryJobConfig(query_parameters=params)
+
+    def _fetch_campaign_daily(
+        self, days_back: int, customer_id: str = None, campaign: str = None
+    ) -> pd.DataFrame:
+        """Daily totals, summed in BigQuery when querying it directly."""
+        # Sample/cache/API sources only have row-level data
+        if customer_id or self.bq_client is None:
+            df = self.load_campaign_data(days_back, customer_id)
+            if campaign and not df.empty:
+                df = df[df["campaign_name"] == campaign]
+            return _aggregate_daily(df)
+
+        try:
+            where_clause, job_config = self._rollup_job_config(days_back, campaign)
+            query = f"""
+            SELECT
+                date,
+                SUM(impressions) as impressions,
+                SUM(clicks) as clicks,
+                SUM(cost) as cost,
+                SUM(conversions) as conversions,
+                IFNULL(SAFE_DIVIDE(SUM(clicks), SUM(impressions)), 0) * 100 as ctr
+            FROM `{self.bq_client.project_id}.{self.bq_client.dataset_id}.campaigns_performance`
+            {where_clause}
+            GROUP BY date
+            ORDER BY date
+            """
+
+            return self._query_cached(query, job_config)
+        except Exception:
+            return pd.DataFrame()
+
+    def _fetch_campaign_summary(
+        self, days_back: int, customer_id: str = None
+    ) -> pd.DataFrame:
+        """Per-campaign totals, summed in BigQuery when querying it directly."""
+        if customer_id or self.bq_client is None:
+            return _aggregate_campaigns(self.load_campaign_data(days_back, customer_id))
+
+        try:
+            where_clause, job_config = self._rollup_job_config(days_back)
+            query = f"""
+            SELECT
+                campaign_name,
+                SUM(impressions) as impressions,
+                SUM(clicks) as clicks,
+                SUM(cost) as cost,
+                SUM(conversions) as conversions,
+                AVG(ctr) as ctr,
+                AVG(average_cpc_dollars) as cpc,
+                AVG(conversion_rate) as conversion_rate
+            FROM `{self.bq_client.project_id}.{self.bq_client.dataset_id}.campaigns_performance`
+            {where_clause}
+            GROUP BY campaign_name
+            ORDER BY campaign_name
+            """
+
+            return self._query_cached(query, job_config)
+        except Exception:
+            return pd.DataFrame()
+
     def _load_direct_campaign_data(
         self, customer_id: str, days_back: int
     ) -> pd.DataFrame:
         """Load campaign data directly from Google Ads API."""
         try:
-            import os
-            from datetime import datetime, timedelta
-
-            from ads.reporting import ReportingManager
-
             # Try cached data first for known accounts if API fails
             if customer_id == "9639990200":
                 cache_file = "/tmp/sourcegraph_dashboard_cache.csv"
@@ -140,15 +327,16 @@ class GoogleAdsDashboard:
                 cache_file = None
 
             if cache_file:
-                if os.path.exists(cache_file):
-                    try:
-                        df = pd.read_csv(cache_file)
-                        df["date"] = pd.to_datetime(df["date"])
-
-                        # Filter by days_back
-                        cutoff_date = datetime.now() - timedelta(days=days_back)
-                        df = df[df["date"] >= cutoff_date]
-
+                try:
+                    cutoff_date = datetime.now() - timedelta(days=days_back)
+                    df = _read_cached_table(
+                        cache_file,
+                        columns=CAMPAIGN_COLUMNS,
+                        since=cutoff_date,
+                        parse_dates=["date"],
+                        dtype=CAMPAIGN_CACHE_DTYPES,
+                    )
+                    if df is not None:
                         account_name = (
                             "Sourcegraph"
                             if customer_id == "9639990200"
@@ -157,11 +345,11 @@ class GoogleAdsDashboard:
                         st.info(
                             f"📊 Using cached {account_name} data (API connectivity issues)"
                         )
-                        return df
-                    except Exception:
-                        pass
+                        return _downcast(df)
+                except Exception:
+                    pass
 
-            reporting = ReportingManager(customer_id)
+            reporting = _get_reporting_cls()(customer_id)
             df = reporting.get_campaign_performance()
 
             if df.empty:
@@ -172,29 +360,14 @@ class GoogleAdsDashboard:
             df["cost"] = df["cost_micros"] / 1_000_000  # Convert from micros to dollars
             df["cpc"] = df["average_cpc"] / 1_000_000  # Convert from micros to dollars
             df["status"] = df["campaign_status"]
-            df["conversion_rate"] = (df["conversions"] / df["clicks"] * 100).fillna(0)
+            df["conversion_rate"] = _percent(df["conversions"], df["clicks"])
 
             # Filter by days_back
             cutoff_date = datetime.now() - timedelta(days=days_back)
             df = df[df["date"] >= cutoff_date]
 
             # Select and rename columns to match expected schema
-            return df[
-                [
-                    "date",
-                    "customer_id",
-                    "campaign_id",
-                    "campaign_name",
-                    "status",
-                    "impressions",
-                    "clicks",
-                    "cost",
-                    "conversions",
-                    "ctr",
-                    "cpc",
-                    "conversion_rate",
-                ]
-            ]
+            return _downcast(df[CAMPAIGN_COLUMNS])
 
         except Exception as e:
             st.error(f"Error loading direct API data: {e}")
@@ -202,6 +375,12 @@ class GoogleAdsDashboard:
 
     def load_keyword_data(
         self, days_back: int = 30, customer_id: str = None
+    ) -> pd.DataFrame:
+        """Load keyword performance data, cached across reruns."""
+        return _load_keyword_cached(days_back, customer_id)
+
+    def _fetch_keyword_data(
+        self, days_back: int = 30, customer_id: str = None
     ) -> pd.DataFrame:
         """Load keyword performance data from BigQuery or direct API."""
         # Always use direct API for demo mode or if BigQuery is unavailable
@@ -219,27 +398,19 @@ class GoogleAdsDashboard:
             SELECT
                 date,
                 customer_id,
-                campaign_id,
                 '' as campaign_name,
-                ad_group_id,
-                '' as ad_group_name,
-                criterion_id as keyword_id,
                 keyword_text,
-                match_type,
                 impressions,
                 clicks,
                 cost,
                 conversions,
-                ctr,
-                average_cpc_dollars as cpc,
-                (conversions / clicks * 100) as conversion_rate,
                 quality_score
             FROM `{self.bq_client.project_id}.{self.bq_client.dataset_id}.keywords_performance`
             {where_clause}
-            ORDER BY date DESC, campaign_name, keyword_text
+            ORDER BY date DESC, keyword_text
             """
 
-            return self.bq_client.query(query)
+            return self._query_cached(query)
         except Exception:
             # Fallback to direct API for any account if BigQuery fails
             if customer_id:
@@ -251,11 +422,6 @@ class GoogleAdsDashboard:
     ) -> pd.DataFrame:
         """Load keyword data directly from Google Ads API."""
         try:
-            import os
-            from datetime import datetime
-
-            from ads.keywords import list_keywords
-
             # Try cached keyword analysis first
             if customer_id == "9639990200":
                 cache_file = "/tmp/sourcegraph_keyword_detailed.csv"
@@ -263,9 +429,11 @@ class GoogleAdsDashboard:
                 cache_file = "/tmp/singlestore_keyword_detailed.csv"
             else:
                 cache_file = None
-            if os.path.exists(cache_file):
+            if cache_file:
                 try:
-                    df = pd.read_csv(cache_file)
+                    df = _read_cached_table(cache_file, columns=KEYWORD_COLUMNS)
+                    if df is None:
+                        raise FileNotFoundError(cache_file)
                     if "keyword_text" not in df.columns and "keyword" in df.columns:
                         df["keyword_text"] = df["keyword"]
 
@@ -273,10 +441,7 @@ class GoogleAdsDashboard:
                     for col in [
                         "date",
                         "customer_id",
-                        "campaign_id",
                         "campaign_name",
-                        "ad_group_id",
-                        "ad_group_name",
                         "quality_score",
                     ]:
                         if col not in df.columns:
@@ -284,7 +449,7 @@ class GoogleAdsDashboard:
                                 df[col] = datetime.now().date()
                             elif col == "customer_id":
                                 df[col] = customer_id
-                            elif col in ["campaign_id", "ad_group_id", "quality_score"]:
+                            elif col == "quality_score":
                                 df[col] = 0
                             else:
                                 df[col] = ""
@@ -297,7 +462,7 @@ class GoogleAdsDashboard:
                         else "Account"
                     )
                     st.info(f"📊 Using cached {account_name} keyword analysis data")
-                    return df
+                    return _downcast(df)
                 except Exception:
                     pass
 
@@ -313,7 +478,6 @@ class GoogleAdsDashboard:
             df["customer_id"] = customer_id
             df["keyword_text"] = df.get("keyword", "")
             df["campaign_name"] = ""
-            df["ad_group_name"] = ""
             df["quality_score"] = 0
             df["cost"] = (
                 df.get("cost_micros", df.get("cost", 0)) / 1_000_000
@@ -321,18 +485,294 @@ class GoogleAdsDashboard:
                 else df.get("cost", 0)
             )
             df["cpc"] = df.get("avg_cpc", 0)
-            df["ctr"] = (df["clicks"] / df["impressions"] * 100).fillna(0)
-            df["conversion_rate"] = (
-                df.get("conversions", 0) / df["clicks"] * 100
-            ).fillna(0)
+            df["ctr"] = _percent(df["clicks"], df["impressions"])
+            df["conversion_rate"] = _percent(df.get("conversions", 0), df["clicks"])
 
-            return df
+            return _downcast(df)
 
         except Exception as e:
             st.error(f"Error loading keyword data: {e}")
             return pd.DataFrame()
 
 
+@functools.cache
+def _get_reporting_cls():
+    """ReportingManager, imported on first use; ads.reporting is slow to load."""
+    from ads.reporting import ReportingManager
+
+    return ReportingManager
+
+
+def _percent(numerator, denominator) -> np.ndarray:
+    """100 * numerator / denominator, with 0 wherever the denominator is 0."""
+    numerator = np.asarray(numerator, dtype="float64")
+    denominator = np.asarray(denominator, dtype="float64")
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out * 100
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """Narrow dashboard columns to the smallest dtype that holds them.
+
+    Counts shrink to the smallest integer type and ratios to float32; cost and
+    conversions stay float64 since they are summed into the headline totals.
+    Campaign names and statuses become categoricals.
+    """
+    columns = {
+        col: pd.to_numeric(df[col], downcast=downcast)
+        for cols, downcast in (
+            (("impressions", "clicks"), "integer"),
+            (("ctr", "cpc", "conversion_rate"), "float"),
+        )
+        for col in cols
+        if col in df.columns
+    }
+    for col in ("campaign_name", "status"):
+        if col in df.columns:
+            columns[col] = df[col].astype("category")
+    return df.assign(**columns)
+
+
+def _read_cached_table(
+    csv_path: str,
+    columns: list[str] | None = None,
+    since: datetime | None = None,
+    **read_csv_kwargs,
+) -> pd.DataFrame | None:
+    """Read a CSV cache through a Parquet sidecar.
+
+    The first read converts ``csv_path`` to a snappy Parquet file next to it;
+    later reads load only ``columns`` from Parquet and push the ``since`` date
+    filter down to the reader. The sidecar is rebuilt when the CSV is newer.
+    Falls back to a chunked CSV read if the sidecar cannot be written.
+
+    Args:
+        csv_path: Path to the source CSV.
+        columns: Columns to load; names missing from the file are ignored.
+        since: Keep only rows whose ``date`` is on or after this value.
+        **read_csv_kwargs: Passed to ``pd.read_csv`` (e.g. ``dtype``).
+
+    Returns:
+        The loaded frame, or None when neither the CSV nor Parquet exists.
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    has_csv = os.path.exists(csv_path)
+    has_parquet = os.path.exists(parquet_path)
+    if not has_csv and not has_parquet:
+        return None
+
+    if has_csv and (
+        not has_parquet
+        or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path)
+    ):
+        try:
+            tmp_path = f"{parquet_path}.tmp"
+            pd.read_csv(csv_path, **read_csv_kwargs).to_parquet(
+                tmp_path, compression="snappy", index=False
+            )
+            os.replace(tmp_path, parquet_path)
+        except OSError:
+            chunks = pd.read_csv(
+                csv_path, chunksize=CSV_CHUNK_ROWS, **read_csv_kwargs
+            )
+            df = pd.concat(
+                (
+                    chunk if since is None else chunk[chunk["date"] >= since]
+                    for chunk in chunks
+                ),
+                ignore_index=True,
+            )
+            return df[[c for c in columns if c in df.columns]] if columns else df
+
+    if columns:
+        available = set(pq.read_schema(parquet_path).names)
+        columns = [c for c in columns if c in available]
+    filters = [("date", ">=", pd.Timestamp(since))] if since is not None else None
+    return pd.read_parquet(parquet_path, columns=columns, filters=filters)
+
+
+# Account metadata rarely changes; fetch it concurrently and keep it an hour.
+@st.cache_data(ttl=3600, show_spinner=False)
+def _get_customer_infos(account_ids: tuple[str, ...]) -> dict[str, dict]:
+    if not account_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(16, len(account_ids))) as pool:
+        return dict(zip(account_ids, pool.map(get_customer_info, account_ids)))
+
+
+@st.cache_resource
+def _get_dashboard() -> GoogleAdsDashboard:
+    """Shared dashboard instance so reruns reuse the BigQuery client."""
+    return GoogleAdsDashboard()
+
+
+# The account list only changes when the user asks for a refresh, so it lives
+# for the whole process; the sidebar 🔄 button clears it. Errors propagate
+# (Streamlit does not cache them) and get_accessible_accounts falls back.
+@st.cache_resource(show_spinner=False)
+def _get_accounts_cached() -> dict[str, str]:
+    return _get_dashboard()._fetch_accessible_accounts()
+
+
+# Reruns (filter changes, button clicks) reuse the last result for 10 minutes
+# instead of re-querying BigQuery or re-reading the CSV caches. Keyed on the
+# primitive arguments only; the client comes from the shared dashboard.
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_campaign_cached(days_back: int, customer_id: str | None) -> pd.DataFrame:
+    return _get_dashboard()._fetch_campaign_data(days_back, customer_id)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_keyword_cached(days_back: int, customer_id: str | None) -> pd.DataFrame:
+    return _get_dashboard()._fetch_keyword_data(days_back, customer_id)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_campaign_daily_cached(
+    days_back: int, customer_id: str | None, campaign: str | None
+) -> pd.DataFrame:
+    return _get_dashboard()._fetch_campaign_daily(days_back, customer_id, campaign)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_campaign_summary_cached(
+    days_back: int, customer_id: str | None
+) -> pd.DataFrame:
+    return _get_dashboard()._fetch_campaign_summary(days_back, customer_id)
+
+
+def _aggregate_daily(df: pd.DataFrame) -> pd.DataFrame:
+    """Daily totals and CTR from row-level campaign data."""
+    if df.empty:
+        return pd.DataFrame()
+    daily = (
+        df.groupby("date")
+        .agg(
+            {
+                "impressions": "sum",
+                "clicks": "sum",
+                "cost": "sum",
+                "conversions": "sum",
+            }
+        )
+        .reset_index()
+    )
+    daily["ctr"] = _percent(daily["clicks"], daily["impressions"])
+    return daily
+
+
+def _aggregate_campaigns(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-campaign totals from row-level campaign data."""
+    if df.empty:
+        return pd.DataFrame()
+    return (
+        df.groupby("campaign_name", observed=True)
+        .agg(
+            {
+                "impressions": "sum",
+                "clicks": "sum",
+                "cost": "sum",
+                "conversions": "sum",
+                "ctr": "mean",
+                "cpc": "mean",
+                "conversion_rate": "mean",
+            }
+        )
+        .reset_index()
+    )
+
+
+# Keyed on the file's mtime as well as its path, so a fresh analysis run
+# invalidates the entry without clearing anything by hand.
+@st.cache_data(show_spinner=False)
+def _load_analysis(path: str, mtime: float) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+# Keyed on the filters that produced the frame; the frame itself
+# (underscore-prefixed) is not hashed. Same TTL as the loaders above.
+@st.cache_data(ttl=600, show_spinner=False)
+def _top_keywords(
+    days_back: int, customer_id: str | None, campaign: str, _df: pd.DataFrame
+) -> pd.DataFrame:
+    top_keywords = (
+        _df.groupby("keyword_text")
+        .agg(
+            {
+                "clicks": "sum",
+                "impressions": "sum",
+                "cost": "sum",
+                "conversions": "sum",
+                "quality_score": "mean",
+            }
+        )
+        .reset_index()
+    )
+    return top_keywords.nlargest(20, "clicks")
+
+
+# Figures are rebuilt only when the filters behind them change. uirevision
+# keeps the browser's zoom/pan state while the same account stays selected.
+@st.cache_data(ttl=600, show_spinner=False)
+def _daily_figures(
+    days_back: int, customer_id: str | None, campaign: str, _daily: pd.DataFrame
+) -> tuple[go.Figure, go.Figure]:
+    ui_revision = customer_id or "all"
+
+    trend = px.line(
+        _daily,
+        x="date",
+        y=["clicks", "conversions"],
+        title="Clicks & Conversions Over Time",
+    )
+    trend.update_layout(height=400, uirevision=ui_revision)
+
+    cost_ctr = go.Figure()
+    cost_ctr.add_trace(
+        go.Scatter(x=_daily["date"], y=_daily["cost"], name="Daily Cost", yaxis="y")
+    )
+    cost_ctr.add_trace(
+        go.Scatter(x=_daily["date"], y=_daily["ctr"], name="CTR %", yaxis="y2")
+    )
+    cost_ctr.update_layout(
+        title="Daily Cost vs CTR",
+        yaxis={"title": "Cost ($)", "side": "left"},
+        yaxis2={"title": "CTR (%)", "side": "right", "overlaying": "y"},
+        height=400,
+        uirevision=ui_revision,
+    )
+    return trend, cost_ctr
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _top_keyword_figures(
+    days_back: int, customer_id: str | None, campaign: str, _top: pd.DataFrame
+) -> tuple[go.Figure, go.Figure]:
+    ui_revision = customer_id or "all"
+
+    clicks = px.bar(
+        _top.head(10),
+        x="keyword_text",
+        y="clicks",
+        title="Top 10 Keywords by Clicks",
+    )
+    clicks.update_xaxes(tickangle=45)
+    clicks.update_layout(height=400, uirevision=ui_revision)
+
+    bubble = px.scatter(
+        _top,
+        x="cost",
+        y="conversions",
+        size="clicks",
+        hover_data=["keyword_text", "quality_score"],
+        title="Cost vs Conversions (bubble size = clicks)",
+    )
+    bubble.update_layout(height=400, uirevision=ui_revision)
+    return clicks, bubble
+
+
 def main():
     """Main Streamlit app."""
     st.set_page_config(
@@ -347,7 +787,7 @@ def main():
 
     # Initialize dashboard
     try:
-        dashboard = GoogleAdsDashboard()
+        dashboard = _get_dashboard()
     except Exception as e:
         st.error(f"Failed to connect to BigQuery: {e}")
         st.stop()
@@ -365,20 +805,16 @@ def main():
     with col1:
         accounts = dashboard.get_accessible_accounts()
         if accounts:
-            account_options = ["All Accounts"] + [
-                f"{name} ({acc_id})" for acc_id, name in accounts.items()
-            ]
-            selected_account_option = st.selectbox(
-                "Google Ads Account", account_options
+            # The widget returns the customer ID itself (None for all accounts)
+            selected_customer_id = st.selectbox(
+                "Google Ads Account",
+                [None, *accounts],
+                format_func=lambda acc_id: (
+                    "All Accounts"
+                    if acc_id is None
+                    else f"{accounts[acc_id]} ({acc_id})"
+                ),
             )
-
-            if selected_account_option == "All Accounts":
-                selected_customer_id = None
-            else:
-                # Extract customer ID from the display format "Name (ID)"
-                selected_customer_id = selected_account_option.split("(")[-1].rstrip(
-                    ")"
-                )
         else:
             selected_customer_id = None
             st.warning("No accessible accounts found")
@@ -390,15 +826,18 @@ def main():
     # Load data
     with st.spinner("Loading campaign data..."):
         try:
-            campaign_df = dashboard.load_campaign_data(days_back, selected_customer_id)
-            keyword_df = dashboard.load_keyword_data(days_back, selected_customer_id)
+            all_campaigns = dashboard.load_campaign_summary(
+                days_back, selected_customer_id
+            )
         except Exception as e:
             st.error(f"Error loading data: {e}")
             st.stop()
 
-    if campaign_df.empty:
+    if all_campaigns.empty:
         account_info = (
-            f" for account {selected_account_option}" if selected_customer_id else ""
+            f" for account {accounts[selected_customer_id]} ({selected_customer_id})"
+            if selected_customer_id
+            else ""
         )
         st.warning(
             f"No campaign data found for the selected time period{account_info}."
@@ -406,124 +845,107 @@ def main():
         st.stop()
 
     # Campaign filter
-    campaigns = ["All"] + sorted(campaign_df["campaign_name"].unique().tolist())
+    campaigns = ["All"] + sorted(all_campaigns["campaign_name"].unique().tolist())
     selected_campaign = st.sidebar.selectbox("Campaign", campaigns)
+    campaign_filter = None if selected_campaign == "All" else selected_campaign
 
     # Filter data based on selection
-    if selected_campaign != "All":
-        campaign_df = campaign_df[campaign_df["campaign_name"] == selected_campaign]
-        keyword_df = keyword_df[keyword_df["campaign_name"] == selected_campaign]
+    campaign_summary = all_campaigns
+    if campaign_filter:
+        campaign_summary = all_campaigns[
+            all_campaigns["campaign_name"] == campaign_filter
+        ]
+
+    # Everything the filtered frames depend on, for the cached aggregations
+    agg_key = (days_back, selected_customer_id, selected_campaign)
 
     # Key Metrics Row
     st.header("📈 Key Performance Metrics")
 
     col1, col2, col3, col4 = st.columns(4)
 
+    # Single reduction over the four metric columns (upcasts to float, so
+    # restore the integer counters for display)
+    totals = campaign_summary[["impressions", "clicks", "cost", "conversions"]].sum()
+    total_impressions = int(totals["impressions"])
+    total_clicks = int(totals["clicks"])
+    total_cost = totals["cost"]
+    total_conversions = totals["conversions"]
+
+    avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
+    avg_cpc = (total_cost / total_clicks) if total_clicks > 0 else 0
+    conv_rate = (total_conversions / total_clicks * 100) if total_clicks > 0 else 0
+
     with col1:
-        total_impressions = campaign_df["impressions"].sum()
         st.metric("Total Impressions", f"{total_impressions:,}")
 
     with col2:
-        total_clicks = campaign_df["clicks"].sum()
-        avg_ctr = (
-            (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
-        )
         st.metric("Total Clicks", f"{total_clicks:,}", f"{avg_ctr:.2f}% CTR")
 
     with col3:
-        total_cost = campaign_df["cost"].sum()
-        avg_cpc = (total_cost / total_clicks) if total_clicks > 0 else 0
         st.metric("Total Spend", f"${total_cost:,.2f}", f"${avg_cpc:.2f} CPC")
 
     with col4:
-        total_conversions = campaign_df["conversions"].sum()
-        conv_rate = (total_conversions / total_clicks * 100) if total_clicks > 0 else 0
         st.metric("Conversions", f"{total_conversions:,}", f"{conv_rate:.2f}% Rate")
 
     # Charts Row 1
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.subheader("📊 Daily Performance Trend")
-        daily_data = (
-            campaign_df.groupby("date")
-            .agg(
-                {
-                    "impressions": "sum",
-                    "clicks": "sum",
-                    "cost": "sum",
-                    "conversions": "sum",
-                }
-            )
-            .reset_index()
-        )
-
-        fig = px.line(
-            daily_data,
-            x="date",
-            y=["clicks", "conversions"],
-            title="Clicks & Conversions Over Time",
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+    daily_data = dashboard.load_campaign_daily(
+        days_back, selected_customer_id, campaign_filter
+    )
+    # The daily rollup is a separate query and can fail on its own
+    if daily_data.empty:
+        st.warning("Daily performance data is unavailable; charts are hidden.")
+    else:
+        col1, col2 = st.columns(2)
+        trend_fig, cost_ctr_fig = _daily_figures(*agg_key, daily_data)
 
-    with col2:
-        st.subheader("💰 Cost & CTR Analysis")
-        daily_data["ctr"] = (
-            daily_data["clicks"] / daily_data["impressions"] * 100
-        ).fillna(0)
-
-        fig = go.Figure()
-        fig.add_trace(
-            go.Scatter(
-                x=daily_data["date"], y=daily_data["cost"], name="Daily Cost", yaxis="y"
-            )
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=daily_data["date"], y=daily_data["ctr"], name="CTR %", yaxis="y2"
-            )
-        )
+        with col1:
+            st.subheader("📊 Daily Performance Trend")
+            st.plotly_chart(trend_fig, use_container_width=True)
 
-        fig.update_layout(
-            title="Daily Cost vs CTR",
-            yaxis={"title": "Cost ($)", "side": "left"},
-            yaxis2={"title": "CTR (%)", "side": "right", "overlaying": "y"},
-            height=400,
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            st.subheader("💰 Cost & CTR Analysis")
+            st.plotly_chart(cost_ctr_fig, use_container_width=True)
 
     # Campaign Performance Table
     st.header("🎯 Campaign Performance Summary")
 
-    campaign_summary = (
-        campaign_df.groupby("campaign_name")
-        .agg(
-            {
-                "impressions": "sum",
-                "clicks": "sum",
-                "cost": "sum",
-                "conversions": "sum",
-                "ctr": "mean",
-                "cpc": "mean",
-                "conversion_rate": "mean",
-            }
-        )
-        .reset_index()
+    # Formatting happens in the browser; the columns stay numeric and sortable
+    st.dataframe(
+        campaign_summary,
+        use_container_width=True,
+        column_config={
+            "cost": st.column_config.NumberColumn(format="$%.2f"),
+            "ctr": st.column_config.NumberColumn(format="%.2f%%"),
+            "cpc": st.column_config.NumberColumn(format="$%.2f"),
+            "conversion_rate": st.column_config.NumberColumn(format="%.2f%%"),
+        },
     )
 
-    # Format the dataframe for display
-    campaign_summary["cost"] = campaign_summary["cost"].apply(lambda x: f"${x:,.2f}")
-    campaign_summary["ctr"] = campaign_summary["ctr"].apply(lambda x: f"{x:.2f}%")
-    campaign_summary["cpc"] = campaign_summary["cpc"].apply(lambda x: f"${x:.2f}")
-    campaign_summary["conversion_rate"] = campaign_summary["conversion_rate"].apply(
-        lambda x: f"{x:.2f}%"
-    )
-
-    st.dataframe(campaign_summary, use_container_width=True)
+    # Row-level data is only fetched on request
+    with st.expander("📋 Campaign Details", expanded=False):
+        if st.checkbox("Load daily rows per campaign", key="load_campaign_rows"):
+            campaign_rows = dashboard.load_campaign_data(
+                days_back, selected_customer_id
+            )
+            if campaign_filter and not campaign_rows.empty:
+                campaign_rows = campaign_rows[
+                    campaign_rows["campaign_name"] == campaign_filter
+                ]
+            st.dataframe(campaign_rows, use_container_width=True)
+
+    # Accounts with a keyword analysis report read it from disk instead of
+    # keyword rows, so only load keywords for the generic top-keywords section
+    has_analysis = selected_customer_id in ["9639990200", "4174586061"]
+    keyword_df = pd.DataFrame()
+    if not has_analysis:
+        with st.spinner("Loading keyword data..."):
+            keyword_df = dashboard.load_keyword_data(days_back, selected_customer_id)
+        if campaign_filter and not keyword_df.empty:
+            keyword_df = keyword_df[keyword_df["campaign_name"] == campaign_filter]
 
     # Account-specific keyword analysis section
-    if selected_customer_id in ["9639990200", "4174586061"]:
+    if has_analysis:
         account_name = (
             "Sourcegraph" if selected_customer_id == "9639990200" else "SingleStore"
         )
@@ -532,19 +954,17 @@ def main():
         # Load keyword analysis results
         if selected_customer_id == "9639990200":
             analysis_file = "/tmp/sourcegraph_keyword_analysis.json"
-            analysis_script = "sourcegraph_keyword_analysis.py"
+            analysis_module = "sourcegraph_keyword_analysis"
         else:
             analysis_file = "/tmp/singlestore_keyword_analysis.json"
-            analysis_script = "singlestore_keyword_analysis.py"
+            analysis_module = "singlestore_keyword_analysis"
         keyword_analysis = None
 
-        import json
-        import os
-
         if os.path.exists(analysis_file):
             try:
-                with open(analysis_file) as f:
-                    keyword_analysis = json.load(f)
+                keyword_analysis = _load_analysis(
+                    analysis_file, os.path.getmtime(analysis_file)
+                )
                 st.success("📊 Showing latest keyword analysis results")
             except Exception:
                 pass
@@ -608,7 +1028,7 @@ def main():
                         title="Top 5 Keywords by Impressions",
                     )
                     fig.update_xaxes(tickangle=45)
-                    fig.update_layout(height=400)
+                    fig.update_layout(height=400, uirevision=selected_customer_id)
                     st.plotly_chart(fig, use_container_width=True)
 
             with col2:
@@ -623,7 +1043,7 @@ def main():
                         title="Top 5 Keywords by Clicks",
                     )
                     fig.update_xaxes(tickangle=45)
-                    fig.update_layout(height=400)
+                    fig.update_layout(height=400, uirevision=selected_customer_id)
                     st.plotly_chart(fig, use_container_width=True)
 
         else:
@@ -634,26 +1054,18 @@ def main():
             ):
                 with st.spinner(f"Analyzing {account_name} keywords..."):
                     try:
-                        import subprocess
-
-                        result = subprocess.run(
-                            ["poetry", "run", "python", analysis_script],
-                            cwd="/Users/joelhorwitz/dev/ai-adwords",
-                            env={
-                                **os.environ,
-                                "ADS_USE_DEMO": "1",
-                                "CUSTOMER_ID": selected_customer_id,
-                            },
-                            capture_output=True,
-                            text=True,
-                        )
+                        # The analysis scripts live at the repository root
+                        repo_root = os.path.join(os.path.dirname(__file__), "..", "..")
+                        if repo_root not in sys.path:
+                            sys.path.append(repo_root)
+                        analysis = importlib.import_module(analysis_module)
 
-                        if result.returncode == 0:
+                        if analysis.run(selected_customer_id):
                             st.success(
                                 "✅ Analysis complete! Refresh the page to see results."
                             )
                         else:
-                            st.error(f"Analysis failed: {result.stderr}")
+                            st.error("Analysis failed: no keyword data available")
 
                     except Exception as e:
                         st.error(f"Failed to run analysis: {e}")
@@ -663,46 +1075,16 @@ def main():
         st.header("🔍 Top Performing Keywords")
 
         # Top keywords by clicks
-        top_keywords = (
-            keyword_df.groupby("keyword_text")
-            .agg(
-                {
-                    "clicks": "sum",
-                    "impressions": "sum",
-                    "cost": "sum",
-                    "conversions": "sum",
-                    "quality_score": "mean",
-                }
-            )
-            .reset_index()
-        )
-
-        top_keywords = top_keywords.sort_values("clicks", ascending=False).head(20)
+        top_keywords = _top_keywords(*agg_key, keyword_df)
+        clicks_fig, bubble_fig = _top_keyword_figures(*agg_key, top_keywords)
 
         col1, col2 = st.columns(2)
 
         with col1:
-            fig = px.bar(
-                top_keywords.head(10),
-                x="keyword_text",
-                y="clicks",
-                title="Top 10 Keywords by Clicks",
-            )
-            fig.update_xaxes(tickangle=45)
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(clicks_fig, use_container_width=True)
 
         with col2:
-            fig = px.scatter(
-                top_keywords,
-                x="cost",
-                y="conversions",
-                size="clicks",
-                hover_data=["keyword_text", "quality_score"],
-                title="Cost vs Conversions (bubble size = clicks)",
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(bubble_fig, use_container_width=True)
 
     # Conversion Validation Section
     if selected_customer_id:
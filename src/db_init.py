@@ -24,21 +24,22 @@ async def init_database():
     
     # Add seed data
     async with get_async_db() as db:
-        # Check if admin user exists
         admin_email = "admin@example.com"
+        viewer_email = "viewer@example.com"
         
-        # Simple query to check if user exists
+        # Look up both seed users in a single query
         from sqlalchemy import select
-        stmt = select(User).where(User.email == admin_email)
+        stmt = select(User).where(User.email.in_([admin_email, viewer_email]))
         result = await db.execute(stmt)
-        existing_admin = result.scalar_one_or_none()
+        existing = {user.email: user for user in result.scalars()}
         
-        if not existing_admin:
+        if admin_email not in existing:
             # Create admin user
             admin_password = "admin123456789"  # Change in production
             admin_user = User(
                 email=admin_email,
-                password_hash=hash_password(admin_password),
+                # Argon2 is deliberately slow; hash off the event loop
+                password_hash=await asyncio.to_thread(hash_password, admin_password),
                 name="Admin User",
                 role=UserRole.ADMIN,
                 created_at=datetime.utcnow(),
@@ -46,7 +47,6 @@ async def init_database():
             )
             
             db.add(admin_user)
-            await db.flush()
             
             logger.info(f"✅ Created admin user: {admin_email}")
             logger.info(f"📝 Admin password: {admin_password}")
@@ -54,12 +54,7 @@ async def init_database():
             logger.info(f"ℹ️  Admin user already exists: {admin_email}")
         
         # Create sample viewer user
-        viewer_email = "viewer@example.com"
-        stmt = select(User).where(User.email == viewer_email)
-        result = await db.execute(stmt)
-        existing_viewer = result.scalar_one_or_none()
-        
-        if not existing_viewer:
+        if viewer_email not in existing:
             viewer_user = User(
                 email=viewer_email,
                 name="Viewer User",
@@ -69,12 +64,12 @@ async def init_database():
             )
             
             db.add(viewer_user)
-            await db.flush()
             
             logger.info(f"✅ Created viewer user: {viewer_email} (passwordless)")
         else:
             logger.info(f"ℹ️  Viewer user already exists: {viewer_email}")
         
+        await db.flush()
         await db.commit()
     
     logger.info("🎉 Database initialization complete!")
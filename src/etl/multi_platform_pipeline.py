@@ -1,18 +1,207 @@
 """Multi-platform ETL pipeline for Reddit, Microsoft, and LinkedIn Ads to BigQuery."""
 
+import functools
 import logging
+import operator
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta, timezone
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
 import asyncio
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import orjson
+import pyarrow as pa
+from google.api_core import retry
+from google.api_core.exceptions import Forbidden, TooManyRequests
 
 from ..ads.bigquery_client import create_bigquery_client_from_env
+from ..integrations.helpers import ratio
 from ..integrations.reddit_ads import RedditAdsClient
 from ..integrations.microsoft_ads import MicrosoftAdsClient
 
 logger = logging.getLogger(__name__)
 
+# Arrow schema matching the BigQuery ad_metrics table (see
+# BigQueryClient.create_ad_metrics_table). "raw" is carried as a JSON string.
+AD_METRICS_SCHEMA = pa.schema([
+    ("date", pa.date32()),
+    ("platform", pa.string()),
+    ("account_id", pa.string()),
+    ("account_name", pa.string()),
+    ("campaign_id", pa.string()),
+    ("campaign_name", pa.string()),
+    ("adgroup_id", pa.string()),
+    ("adgroup_name", pa.string()),
+    ("ad_id", pa.string()),
+    ("ad_name", pa.string()),
+    ("impressions", pa.int64()),
+    ("clicks", pa.int64()),
+    ("spend", pa.float64()),
+    ("conversions", pa.float64()),
+    ("ctr", pa.float64()),
+    ("cpc", pa.float64()),
+    ("cpm", pa.float64()),
+    ("conversion_rate", pa.float64()),
+    ("cost_per_conversion", pa.float64()),
+    ("revenue", pa.float64()),
+    ("roas", pa.float64()),
+    ("raw", pa.string()),
+    ("updated_at", pa.timestamp("us", tz="UTC")),
+])
+
+
+# Rows per BigQuery load job; larger syncs are split into several jobs.
+BQ_LOAD_BATCH_ROWS = int(os.getenv("BQ_LOAD_BATCH_ROWS", "100000"))
+
+# Keep each row's source payload in the "raw" column; off by default to keep loads small.
+STORE_RAW = os.getenv("STORE_RAW", "0") == "1"
+
+# Maximum number of platform syncs running at once.
+ETL_MAX_CONCURRENT = int(os.getenv("ETL_MAX_CONCURRENT", "4"))
+
+# Maximum number of LinkedIn campaign analytics requests in flight at once.
+LINKEDIN_ANALYTICS_CONCURRENCY = 10
+
+# Error reasons BigQuery reports when load jobs or table updates are throttled.
+_RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded"})
+
+
+def _is_rate_limited(exc: Exception) -> bool:
+    """Whether a BigQuery error is a rate limit worth retrying.
+
+    Load jobs and table updates over their rate limits fail with
+    ``403 rateLimitExceeded`` rather than HTTP 429.
+    """
+    if isinstance(exc, TooManyRequests):
+        return True
+    return isinstance(exc, Forbidden) and any(
+        error.get("reason") in _RATE_LIMIT_REASONS for error in exc.errors
+    )
+
+
+# Back off and retry a batch when BigQuery rate-limits load jobs.
+_LOAD_RETRY = retry.Retry(
+    initial=1.0,
+    maximum=60.0,
+    multiplier=2.0,
+    predicate=_is_rate_limited,
+    deadline=300.0,
+)
+
+
+def _new_metric_columns() -> Dict[str, List[Any]]:
+    """Empty column lists, one per ad_metrics field."""
+    return {name: [] for name in AD_METRICS_SCHEMA.names}
+
+
+def _raw_json(payload: Dict[str, Any]) -> str:
+    """Serialize a source payload for the "raw" JSON column."""
+    return orjson.dumps(payload, default=str).decode()
+
+
+# Model attributes copied straight into ad_metrics columns of the same name.
+_CAMPAIGN_METRIC_FIELDS = (
+    "date", "campaign_id", "campaign_name", "impressions", "clicks", "spend", "conversions"
+)
+_get_campaign_metric_fields = operator.attrgetter(*_CAMPAIGN_METRIC_FIELDS)
+
+# Source fields kept in the "raw" column for Reddit / Microsoft campaign metrics.
+_RAW_CAMPAIGN_FIELDS = {"impressions", "clicks", "spend", "conversions", "ctr", "cpc", "conversion_rate"}
+
+
+def _campaign_metric_columns(metrics_list: List[Any], platform: str,
+                             account_id: str, account_name: str) -> Dict[str, List[Any]]:
+    """Raw ad_metrics columns for a list of per-campaign daily metric models.
+
+    Attributes are read straight off the models with one ``attrgetter`` per
+    row and transposed into columns; derived ratios are filled in afterwards
+    by ``_derive_metrics``.
+    """
+    num_rows = len(metrics_list)
+    columns = _new_metric_columns()
+    columns.update(zip(
+        _CAMPAIGN_METRIC_FIELDS,
+        map(list, zip(*map(_get_campaign_metric_fields, metrics_list))),
+    ))
+    columns["platform"] = [platform] * num_rows
+    columns["account_id"] = [account_id] * num_rows
+    columns["account_name"] = [account_name] * num_rows
+    if STORE_RAW:
+        columns["raw"] = [
+            _raw_json(metrics.model_dump(include=_RAW_CAMPAIGN_FIELDS)) for metrics in metrics_list
+        ]
+    return columns
+
+
+def _derive_metrics(columns: Dict[str, List[Any]], revenue_per_conversion: float) -> None:
+    """Fill the derived ad_metrics columns from the raw counts in one pass each."""
+    impressions = np.asarray(columns["impressions"], dtype=np.int64)
+    clicks = np.asarray(columns["clicks"], dtype=np.int64)
+    spend = np.asarray(columns["spend"], dtype=np.float64)
+    conversions = np.asarray(columns["conversions"], dtype=np.float64)
+    revenue = np.round(conversions * revenue_per_conversion, 2)
+
+    columns["ctr"] = ratio(clicks, impressions, 100)
+    columns["cpc"] = ratio(spend, clicks)
+    columns["cpm"] = ratio(spend, impressions, 1000)
+    columns["conversion_rate"] = ratio(conversions, clicks, 100)
+    columns["cost_per_conversion"] = ratio(spend, conversions)
+    columns["revenue"] = revenue
+    columns["roas"] = ratio(revenue, spend)
+
+
+def _metric_columns_to_arrow(columns: Dict[str, List[Any]], updated_at: datetime) -> pa.Table:
+    """Build an ad_metrics Arrow table from column lists.
+
+    Columns left empty (ad group / ad fields, ``raw`` unless STORE_RAW,
+    ``updated_at``) are filled with
+    nulls or the sync's ``updated_at`` timestamp; ``date`` strings are cast
+    to date32.
+    """
+    num_rows = len(columns["date"])
+    arrays = []
+    for field in AD_METRICS_SCHEMA:
+        values = columns[field.name]
+        if field.name == "date":
+            arrays.append(pa.array(values, pa.string()).cast(pa.date32()))
+        elif field.name == "updated_at" and not len(values):
+            arrays.append(pa.repeat(pa.scalar(updated_at, field.type), num_rows))
+        elif not len(values):
+            arrays.append(pa.nulls(num_rows, field.type))
+        else:
+            arrays.append(pa.array(values, field.type))
+    return pa.Table.from_arrays(arrays, schema=AD_METRICS_SCHEMA)
+
+
+# Credentials each platform needs, and the flag that switches it out of mock mode.
+_PLATFORM_CREDENTIALS = {
+    "reddit": (("REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET"), "MOCK_REDDIT"),
+    "microsoft": (
+        ("MICROSOFT_ADS_DEVELOPER_TOKEN", "MICROSOFT_ADS_CLIENT_ID", "MICROSOFT_ADS_CLIENT_SECRET"),
+        "MOCK_MICROSOFT",
+    ),
+    "linkedin": (("LINKEDIN_CLIENT_ID", "LINKEDIN_CLIENT_SECRET"), "MOCK_LINKEDIN"),  # currently mock only
+}
+_PLATFORM_ENV_VARS = tuple(
+    name
+    for required, mock_flag in _PLATFORM_CREDENTIALS.values()
+    for name in (*required, mock_flag)
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_availability(env_values: tuple) -> Dict[str, bool]:
+    """Which platforms are configured for live syncs, for one snapshot of the env."""
+    env = dict(zip(_PLATFORM_ENV_VARS, env_values))
+    platforms = {
+        platform: all(env[name] for name in required)
+        and (env[mock_flag] or "true").lower() == "false"
+        for platform, (required, mock_flag) in _PLATFORM_CREDENTIALS.items()
+    }
+    
+    logger.info(f"Platform availability: {platforms}")
+    return platforms
+
 
 class MultiPlatformETLPipeline:
     """ETL Pipeline for multiple ad platforms to BigQuery synter_analytics."""
@@ -21,39 +210,16 @@ class MultiPlatformETLPipeline:
         """Initialize the multi-platform ETL pipeline."""
         self.bq_client = create_bigquery_client_from_env()
         self.platforms_enabled = self._check_platform_availability()
+        # One load thread per platform so every platform's BigQuery load can overlap
+        self._load_executor = ThreadPoolExecutor(
+            max_workers=len(_PLATFORM_CREDENTIALS), thread_name_prefix="bq-load"
+        )
         logger.info(f"Initialized ETL pipeline for platforms: {list(self.platforms_enabled.keys())}")
     
     def _check_platform_availability(self) -> Dict[str, bool]:
         """Check which platforms have proper API credentials configured."""
-        platforms = {}
-        
-        # Reddit Ads
-        reddit_enabled = bool(
-            os.getenv("REDDIT_CLIENT_ID") and 
-            os.getenv("REDDIT_CLIENT_SECRET") and
-            os.getenv("MOCK_REDDIT", "true").lower() == "false"
-        )
-        platforms["reddit"] = reddit_enabled
-        
-        # Microsoft Ads  
-        microsoft_enabled = bool(
-            os.getenv("MICROSOFT_ADS_DEVELOPER_TOKEN") and
-            os.getenv("MICROSOFT_ADS_CLIENT_ID") and
-            os.getenv("MICROSOFT_ADS_CLIENT_SECRET") and
-            os.getenv("MOCK_MICROSOFT", "true").lower() == "false"
-        )
-        platforms["microsoft"] = microsoft_enabled
-        
-        # LinkedIn Ads (currently mock only)
-        linkedin_enabled = bool(
-            os.getenv("LINKEDIN_CLIENT_ID") and
-            os.getenv("LINKEDIN_CLIENT_SECRET") and
-            os.getenv("MOCK_LINKEDIN", "true").lower() == "false"
-        )
-        platforms["linkedin"] = linkedin_enabled
-        
-        logger.info(f"Platform availability: {platforms}")
-        return platforms
+        env_values = tuple(os.environ.get(name) for name in _PLATFORM_ENV_VARS)
+        return dict(_platform_availability(env_values))
     
     async def sync_all_platforms(self, days_back: int = 7) -> Dict[str, Any]:
         """Sync data from all available platforms to BigQuery."""
@@ -70,24 +236,34 @@ class MultiPlatformETLPipeline:
             "errors": []
         }
         
-        # Run platform syncs in parallel
-        sync_tasks = []
+        # Run platform syncs in parallel, capped at ETL_MAX_CONCURRENT
+        named_tasks: List[Tuple[str, Coroutine[Any, Any, Dict[str, Any]]]] = []
         
         if self.platforms_enabled.get("reddit"):
-            sync_tasks.append(self._sync_reddit_data(start_date, end_date))
+            named_tasks.append(("reddit", self._sync_reddit_data(start_date, end_date)))
             
         if self.platforms_enabled.get("microsoft"):
-            sync_tasks.append(self._sync_microsoft_data(start_date, end_date))
+            named_tasks.append(("microsoft", self._sync_microsoft_data(start_date, end_date)))
             
         if self.platforms_enabled.get("linkedin"):
-            sync_tasks.append(self._sync_linkedin_data(start_date, end_date))
+            named_tasks.append(("linkedin", self._sync_linkedin_data(start_date, end_date)))
         
-        # Execute all platform syncs
-        if sync_tasks:
-            platform_results = await asyncio.gather(*sync_tasks, return_exceptions=True)
-            
-            for i, result in enumerate(platform_results):
-                platform = ["reddit", "microsoft", "linkedin"][i] if i < 3 else f"platform_{i}"
+        semaphore = asyncio.Semaphore(ETL_MAX_CONCURRENT)
+        
+        # Each wrapper returns its platform name, so completion order can't mislabel results
+        async def run_sync(platform: str, sync: Coroutine) -> Tuple[str, Any]:
+            async with semaphore:
+                try:
+                    return platform, await sync
+                except Exception as e:
+                    return platform, e
+        
+        # Handle each platform as soon as it finishes rather than waiting for the slowest
+        if named_tasks:
+            for completed in asyncio.as_completed(
+                [run_sync(platform, sync) for platform, sync in named_tasks]
+            ):
+                platform, result = await completed
                 
                 if isinstance(result, Exception):
                     logger.error(f"Failed to sync {platform} data: {result}")
@@ -106,6 +282,7 @@ class MultiPlatformETLPipeline:
     async def _sync_reddit_data(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """Sync Reddit Ads data to BigQuery."""
         logger.info("🔴 Starting Reddit Ads data sync...")
+        synced_at = datetime.now(timezone.utc)  # updated_at for every row in this sync
         
         try:
             async with RedditAdsClient() as client:
@@ -129,29 +306,17 @@ class MultiPlatformETLPipeline:
                 
                 logger.info(f"Retrieved metrics for {len(metrics_list)} Reddit campaigns")
                 
-                all_records = []
+                # Transform to unified schema, one column at a time
+                columns = _campaign_metric_columns(
+                    metrics_list, "reddit", "reddit_account", "Reddit Account"
+                )
                 
-                for metrics in metrics_list:
-                    # Transform to unified schema
-                    record = self._transform_reddit_metrics(
-                        metrics.date, "reddit_account", "Reddit Account", 
-                        metrics.campaign_id, metrics.campaign_name, 
-                        {
-                            "impressions": metrics.impressions,
-                            "clicks": metrics.clicks,
-                            "spend": metrics.spend,
-                            "conversions": metrics.conversions,
-                            "ctr": metrics.ctr,
-                            "cpc": metrics.cpc,
-                            "conversion_rate": metrics.conversion_rate
-                        }
-                    )
-                    all_records.append(record)
-                
-                if all_records:
+                if columns["date"]:
+                    _derive_metrics(columns, revenue_per_conversion=100.0)  # Assume $100 per conversion
                     # Load to BigQuery
-                    df = pd.DataFrame(all_records)
-                    records_written = await self._load_to_bigquery(df)
+                    records_written = await self._load_to_bigquery(
+                        _metric_columns_to_arrow(columns, synced_at)
+                    )
                     
                     logger.info(f"✅ Reddit sync completed: {records_written} records")
                     return {
@@ -176,6 +341,7 @@ class MultiPlatformETLPipeline:
     async def _sync_microsoft_data(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """Sync Microsoft Ads data to BigQuery."""
         logger.info("🔵 Starting Microsoft Ads data sync...")
+        synced_at = datetime.now(timezone.utc)  # updated_at for every row in this sync
         
         try:
             async with MicrosoftAdsClient() as client:
@@ -199,29 +365,17 @@ class MultiPlatformETLPipeline:
                 
                 logger.info(f"Retrieved metrics for {len(metrics_list)} Microsoft campaigns")
                 
-                all_records = []
+                # Transform to unified schema, one column at a time
+                columns = _campaign_metric_columns(
+                    metrics_list, "microsoft", "microsoft_account", "Microsoft Account"
+                )
                 
-                for metrics in metrics_list:
-                    # Transform to unified schema
-                    record = self._transform_microsoft_metrics(
-                        metrics.date, "microsoft_account", "Microsoft Account",
-                        metrics.campaign_id, metrics.campaign_name,
-                        {
-                            "impressions": metrics.impressions,
-                            "clicks": metrics.clicks,
-                            "spend": metrics.spend,
-                            "conversions": metrics.conversions,
-                            "ctr": metrics.ctr,
-                            "cpc": metrics.cpc,
-                            "conversion_rate": metrics.conversion_rate
-                        }
-                    )
-                    all_records.append(record)
-                
-                if all_records:
+                if columns["date"]:
+                    _derive_metrics(columns, revenue_per_conversion=120.0)  # Assume $120 per conversion
                     # Load to BigQuery
-                    df = pd.DataFrame(all_records)
-                    records_written = await self._load_to_bigquery(df)
+                    records_written = await self._load_to_bigquery(
+                        _metric_columns_to_arrow(columns, synced_at)
+                    )
                     
                     logger.info(f"✅ Microsoft sync completed: {records_written} records")
                     return {
@@ -246,6 +400,7 @@ class MultiPlatformETLPipeline:
     async def _sync_linkedin_data(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """Sync LinkedIn Ads data to BigQuery."""
         logger.info("🔗 Starting LinkedIn Ads data sync...")
+        synced_at = datetime.now(timezone.utc)  # updated_at for every row in this sync
         
         mock_linkedin = os.getenv("MOCK_LINKEDIN", "true").lower() == "true"
         
@@ -253,45 +408,34 @@ class MultiPlatformETLPipeline:
             if mock_linkedin:
                 # Generate mock data when in mock mode
                 logger.info("LinkedIn in mock mode - generating mock data")
-                all_records = []
+                columns = _new_metric_columns()
                 
-                current_date = datetime.strptime(start_date, "%Y-%m-%d")
-                end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
+                dates = np.arange(
+                    np.datetime64(start_date), np.datetime64(end_date) + 1, dtype="datetime64[D]"
+                )
+                day = (dates - dates.astype("datetime64[M]")).astype(np.int64) + 1
+                num_days = len(dates)
                 
-                while current_date <= end_date_obj:
-                    date_str = current_date.strftime("%Y-%m-%d")
-                    
-                    mock_record = {
-                        "date": date_str,
-                        "platform": "linkedin",
-                        "account_id": "linkedin_demo_account",
-                        "account_name": "Demo LinkedIn Ads Account",
-                        "campaign_id": "linkedin_demo_campaign",
-                        "campaign_name": "LinkedIn Demo Campaign",
-                        "adgroup_id": None,
-                        "adgroup_name": None,
-                        "ad_id": None,
-                        "ad_name": None,
-                        "impressions": int(5000 + (current_date.day * 100)),
-                        "clicks": int(150 + (current_date.day * 5)),
-                        "spend": round(300.0 + (current_date.day * 10.5), 2),
-                        "conversions": int(8 + (current_date.day * 0.5)),
-                        "ctr": round((150 + (current_date.day * 5)) / (5000 + (current_date.day * 100)) * 100, 2),
-                        "cpc": round((300.0 + (current_date.day * 10.5)) / (150 + (current_date.day * 5)), 2),
-                        "cpm": round((300.0 + (current_date.day * 10.5)) / (5000 + (current_date.day * 100)) * 1000, 2),
-                        "conversion_rate": round((8 + (current_date.day * 0.5)) / (150 + (current_date.day * 5)) * 100, 2),
-                        "cost_per_conversion": round((300.0 + (current_date.day * 10.5)) / (8 + (current_date.day * 0.5)), 2),
-                        "revenue": round((8 + (current_date.day * 0.5)) * 125.0, 2),
-                        "roas": round(((8 + (current_date.day * 0.5)) * 125.0) / (300.0 + (current_date.day * 10.5)), 2),
-                        "raw": {"source": "mock", "generated_at": datetime.utcnow().isoformat()},
-                        "updated_at": datetime.utcnow()
-                    }
-                    all_records.append(mock_record)
-                    current_date += timedelta(days=1)
+                columns["date"] = np.datetime_as_string(dates, unit="D")
+                columns["platform"] = ["linkedin"] * num_days
+                columns["account_id"] = ["linkedin_demo_account"] * num_days
+                columns["account_name"] = ["Demo LinkedIn Ads Account"] * num_days
+                columns["campaign_id"] = ["linkedin_demo_campaign"] * num_days
+                columns["campaign_name"] = ["LinkedIn Demo Campaign"] * num_days
+                columns["impressions"] = 5000 + day * 100
+                columns["clicks"] = 150 + day * 5
+                columns["spend"] = np.round(300.0 + day * 10.5, 2)
+                columns["conversions"] = np.floor(8 + day * 0.5)
+                if STORE_RAW:
+                    raw = _raw_json({"source": "mock", "generated_at": synced_at.isoformat()})
+                    columns["raw"] = [raw] * num_days
+                _derive_metrics(columns, revenue_per_conversion=125.0)
                 
-                if all_records:
-                    df = pd.DataFrame(all_records)
-                    records_written = await self._load_to_bigquery(df)
+                # Skip the load entirely when there is nothing but zero rows
+                if num_days and columns["impressions"].any():
+                    records_written = await self._load_to_bigquery(
+                        _metric_columns_to_arrow(columns, synced_at)
+                    )
                     
                     logger.info(f"✅ LinkedIn sync completed (mock): {records_written} records")
                     return {
@@ -318,61 +462,69 @@ class MultiPlatformETLPipeline:
                     
                     logger.info(f"Found {len(accounts)} LinkedIn ad accounts")
                     
-                    all_records = []
-                    total_campaigns = 0
+                    columns = _new_metric_columns()
+                    campaign_refs = []
                     
                     for account in accounts:
                         account_id = account.get("id")
                         account_name = account.get("name", f"Account {account_id}")
                         
                         # Get campaigns for this account
-                        campaigns = await client.get_campaigns(account_id)
-                        total_campaigns += len(campaigns)
-                        
-                        for campaign in campaigns:
+                        for campaign in await client.get_campaigns(account_id):
                             campaign_id = campaign.get("id")
                             campaign_name = campaign.get("name", f"Campaign {campaign_id}")
-                            
-                            try:
-                                # Get analytics for this campaign
-                                analytics = await client.get_campaign_analytics(campaign_id, start_date, end_date)
-                                
-                                # Transform daily analytics to records
-                                for date_str, metrics in analytics.items():
-                                    record = {
-                                        "date": date_str,
-                                        "platform": "linkedin",
-                                        "account_id": account_id,
-                                        "account_name": account_name,
-                                        "campaign_id": campaign_id,
-                                        "campaign_name": campaign_name,
-                                        "adgroup_id": None,
-                                        "adgroup_name": None,
-                                        "ad_id": None,
-                                        "ad_name": None,
-                                        "impressions": metrics.get("impressions", 0),
-                                        "clicks": metrics.get("clicks", 0),
-                                        "spend": metrics.get("spend", 0.0),
-                                        "conversions": metrics.get("conversions", 0),
-                                        "ctr": metrics.get("ctr", 0.0),
-                                        "cpc": metrics.get("cpc", 0.0),
-                                        "cpm": metrics.get("cpm", 0.0),
-                                        "conversion_rate": metrics.get("conversion_rate", 0.0),
-                                        "cost_per_conversion": metrics.get("cost_per_conversion", 0.0),
-                                        "revenue": metrics.get("conversions", 0) * 125.0,  # Assume $125 per conversion
-                                        "roas": round((metrics.get("conversions", 0) * 125.0) / max(metrics.get("spend", 1), 1), 2),
-                                        "raw": metrics,
-                                        "updated_at": datetime.utcnow()
-                                    }
-                                    all_records.append(record)
-                                    
-                            except Exception as e:
-                                logger.error(f"Failed to get analytics for LinkedIn campaign {campaign_id}: {e}")
-                                continue
+                            campaign_refs.append((account_id, account_name, campaign_id, campaign_name))
                     
-                    if all_records:
-                        df = pd.DataFrame(all_records)
-                        records_written = await self._load_to_bigquery(df)
+                    total_campaigns = len(campaign_refs)
+                    semaphore = asyncio.Semaphore(LINKEDIN_ANALYTICS_CONCURRENCY)
+                    
+                    async def fetch_analytics(campaign_id):
+                        async with semaphore:
+                            return await client.get_campaign_analytics(campaign_id, start_date, end_date)
+                    
+                    # Fetch analytics for all campaigns concurrently, a bounded number at a time
+                    campaign_analytics = await asyncio.gather(
+                        *(fetch_analytics(ref[2]) for ref in campaign_refs),
+                        return_exceptions=True,
+                    )
+                    
+                    for (account_id, account_name, campaign_id, campaign_name), analytics in zip(
+                        campaign_refs, campaign_analytics
+                    ):
+                        if isinstance(analytics, Exception):
+                            logger.error(f"Failed to get analytics for LinkedIn campaign {campaign_id}: {analytics}")
+                            continue
+                        
+                        # Transform daily analytics to records
+                        for date_str, metrics in analytics.items():
+                            columns["date"].append(date_str)
+                            columns["platform"].append("linkedin")
+                            columns["account_id"].append(account_id)
+                            columns["account_name"].append(account_name)
+                            columns["campaign_id"].append(campaign_id)
+                            columns["campaign_name"].append(campaign_name)
+                            columns["impressions"].append(metrics.get("impressions", 0))
+                            columns["clicks"].append(metrics.get("clicks", 0))
+                            columns["spend"].append(metrics.get("spend", 0.0))
+                            columns["conversions"].append(metrics.get("conversions", 0))
+                            columns["ctr"].append(metrics.get("ctr", 0.0))
+                            columns["cpc"].append(metrics.get("cpc", 0.0))
+                            columns["cpm"].append(metrics.get("cpm", 0.0))
+                            columns["conversion_rate"].append(metrics.get("conversion_rate", 0.0))
+                            columns["cost_per_conversion"].append(metrics.get("cost_per_conversion", 0.0))
+                            if STORE_RAW:
+                                columns["raw"].append(_raw_json(metrics))
+                    
+                    if columns["date"]:
+                        # Ratios come from the API; revenue and ROAS are derived per column
+                        revenue = np.asarray(columns["conversions"], dtype=np.float64) * 125.0  # Assume $125 per conversion
+                        spend = np.asarray(columns["spend"], dtype=np.float64)
+                        columns["revenue"] = revenue
+                        columns["roas"] = np.round(revenue / np.maximum(spend, 1), 2)
+                        
+                        records_written = await self._load_to_bigquery(
+                            _metric_columns_to_arrow(columns, synced_at)
+                        )
                         
                         logger.info(f"✅ LinkedIn sync completed: {records_written} records")
                         return {
@@ -401,108 +553,50 @@ class MultiPlatformETLPipeline:
             logger.error(f"❌ LinkedIn sync failed: {e}")
             raise
     
-    def _transform_reddit_metrics(self, date_str: str, account_id: str, account_name: str,
-                                 campaign_id: str, campaign_name: str, metrics: Dict) -> Dict:
-        """Transform Reddit metrics to unified ad_metrics schema."""
-        impressions = metrics.get("impressions", 0)
-        clicks = metrics.get("clicks", 0)
-        spend = metrics.get("spend", 0.0)
-        conversions = metrics.get("conversions", 0)
-        
-        return {
-            "date": date_str,
-            "platform": "reddit",
-            "account_id": account_id,
-            "account_name": account_name,
-            "campaign_id": campaign_id,
-            "campaign_name": campaign_name,
-            "adgroup_id": None,
-            "adgroup_name": None,
-            "ad_id": None,
-            "ad_name": None,
-            "impressions": impressions,
-            "clicks": clicks,
-            "spend": spend,
-            "conversions": conversions,
-            "ctr": round((clicks / impressions * 100), 2) if impressions > 0 else 0,
-            "cpc": round((spend / clicks), 2) if clicks > 0 else 0,
-            "cpm": round((spend / impressions * 1000), 2) if impressions > 0 else 0,
-            "conversion_rate": round((conversions / clicks * 100), 2) if clicks > 0 else 0,
-            "cost_per_conversion": round((spend / conversions), 2) if conversions > 0 else 0,
-            "revenue": round(conversions * 100.0, 2),  # Assume $100 per conversion
-            "roas": round((conversions * 100.0 / spend), 2) if spend > 0 else 0,
-            "raw": metrics,
-            "updated_at": datetime.utcnow()
-        }
-    
-    def _transform_microsoft_metrics(self, date_str: str, account_id: str, account_name: str,
-                                   campaign_id: str, campaign_name: str, metrics: Dict) -> Dict:
-        """Transform Microsoft Ads metrics to unified ad_metrics schema."""
-        impressions = metrics.get("Impressions", 0)
-        clicks = metrics.get("Clicks", 0)
-        spend = float(metrics.get("Spend", 0))
-        conversions = metrics.get("Conversions", 0)
+    async def _load_to_bigquery(self, table: pa.Table) -> int:
+        """Load an ad_metrics Arrow table to BigQuery in Parquet load-job batches."""
+        if table.num_rows == 0:
+            return 0
         
-        return {
-            "date": date_str,
-            "platform": "microsoft",
-            "account_id": str(account_id),
-            "account_name": account_name,
-            "campaign_id": str(campaign_id),
-            "campaign_name": campaign_name,
-            "adgroup_id": None,
-            "adgroup_name": None,
-            "ad_id": None,
-            "ad_name": None,
-            "impressions": impressions,
-            "clicks": clicks,
-            "spend": spend,
-            "conversions": conversions,
-            "ctr": round((clicks / impressions * 100), 2) if impressions > 0 else 0,
-            "cpc": round((spend / clicks), 2) if clicks > 0 else 0,
-            "cpm": round((spend / impressions * 1000), 2) if impressions > 0 else 0,
-            "conversion_rate": round((conversions / clicks * 100), 2) if clicks > 0 else 0,
-            "cost_per_conversion": round((spend / conversions), 2) if conversions > 0 else 0,
-            "revenue": round(conversions * 120.0, 2),  # Assume $120 per conversion
-            "roas": round((conversions * 120.0 / spend), 2) if spend > 0 else 0,
-            "raw": metrics,
-            "updated_at": datetime.utcnow()
-        }
-    
-    async def _load_to_bigquery(self, df: pd.DataFrame) -> int:
-        """Load DataFrame to BigQuery ad_metrics table."""
         try:
-            # Ensure all required columns are present
-            required_columns = [
-                "date", "platform", "account_id", "account_name",
-                "campaign_id", "campaign_name", "adgroup_id", "adgroup_name", 
-                "ad_id", "ad_name", "impressions", "clicks", "spend", 
-                "conversions", "ctr", "cpc", "cpm", "conversion_rate",
-                "cost_per_conversion", "revenue", "roas", "raw", "updated_at"
-            ]
-            
-            for col in required_columns:
-                if col not in df.columns:
-                    df[col] = None
+            loop = asyncio.get_running_loop()
+            insert = _LOAD_RETRY(self.bq_client.insert_arrow_table)
+            records_written = 0
             
-            # Convert date strings to date objects
-            df["date"] = pd.to_datetime(df["date"]).dt.date
+            for offset in range(0, table.num_rows, BQ_LOAD_BATCH_ROWS):
+                batch = table.slice(offset, BQ_LOAD_BATCH_ROWS)
+                await loop.run_in_executor(self._load_executor, insert, "ad_metrics", batch)
+                records_written += batch.num_rows
             
-            # Insert to BigQuery
-            self.bq_client.insert_dataframe("ad_metrics", df)
-            
-            logger.info(f"Successfully loaded {len(df)} records to BigQuery ad_metrics table")
-            return len(df)
+            logger.info(f"Successfully loaded {records_written} records to BigQuery ad_metrics table")
+            return records_written
             
         except Exception as e:
             logger.error(f"Failed to load data to BigQuery: {e}")
             raise
 
 
+# Shared pipeline for the convenience functions, built on first use. It holds
+# only the BigQuery client and load threads, nothing a single call may close.
+_PIPELINE: Optional[MultiPlatformETLPipeline] = None
+
+
+def _get_pipeline() -> MultiPlatformETLPipeline:
+    """Return the process-wide pipeline, creating its BigQuery client once.
+
+    Construction never awaits, so concurrent callers on the event loop cannot
+    interleave here and no lock is needed.
+    """
+    global _PIPELINE
+    if _PIPELINE is None:
+        _PIPELINE = MultiPlatformETLPipeline()
+    return _PIPELINE
+
+
 # Convenience functions for manual execution
 async def sync_reddit_to_bigquery(days_back: int = 7) -> Dict[str, Any]:
     """Sync Reddit Ads data to BigQuery."""
-    pipeline = MultiPlatformETLPipeline()
+    pipeline = _get_pipeline()
     start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
     end_date = datetime.now().strftime("%Y-%m-%d")
     return await pipeline._sync_reddit_data(start_date, end_date)
@@ -510,7 +604,7 @@ async def sync_reddit_to_bigquery(days_back: int = 7) -> Dict[str, Any]:
 
 async def sync_microsoft_to_bigquery(days_back: int = 7) -> Dict[str, Any]:
     """Sync Microsoft Ads data to BigQuery.""" 
-    pipeline = MultiPlatformETLPipeline()
+    pipeline = _get_pipeline()
     start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
     end_date = datetime.now().strftime("%Y-%m-%d")
     return await pipeline._sync_microsoft_data(start_date, end_date)
@@ -518,5 +612,5 @@ async def sync_microsoft_to_bigquery(days_back: int = 7) -> Dict[str, Any]:
 
 async def sync_all_platforms_to_bigquery(days_back: int = 7) -> Dict[str, Any]:
     """Sync all available platforms to BigQuery."""
-    pipeline = MultiPlatformETLPipeline()
+    pipeline = _get_pipeline()
     return await pipeline.sync_all_platforms(days_back)
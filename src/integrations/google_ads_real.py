@@ -1,12 +1,104 @@
 """Real Google Ads API integration for account discovery and data fetching."""
 
+import asyncio
+import copy
+import functools
 import logging
 import os
-from typing import List, Dict, Optional
+import re
+import weakref
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 
+import aiohttp
+from cachetools import TTLCache
+
+from .helpers import loop_lock
+from .http_session import get_shared_session
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of customer accounts checked at once during discovery,
+# kept well under the Google Ads per-developer QPS limit.
+DISCOVERY_CONCURRENCY = 16
+
+# Enabled campaigns that might reference a domain.
+DOMAIN_CAMPAIGNS_QUERY = """
+    SELECT 
+        campaign.name,
+        campaign.final_url_suffix,
+        campaign.tracking_url_template
+    FROM campaign 
+    WHERE campaign.status = 'ENABLED'
+    LIMIT 10
+"""
+
+# Customer fields plus enabled campaign spend; fill in start_date / end_date.
+ACCOUNT_DETAILS_QUERY = """
+    SELECT 
+        customer.descriptive_name,
+        customer.currency_code,
+        customer.time_zone,
+        customer.status,
+        campaign.id,
+        metrics.cost_micros
+    FROM campaign 
+    WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'
+    AND campaign.status = 'ENABLED'
+"""
+
+# Customer fields alone, for accounts without campaign activity.
+CUSTOMER_INFO_QUERY = """
+    SELECT 
+        customer.descriptive_name,
+        customer.currency_code,
+        customer.time_zone,
+        customer.status
+    FROM customer
+    LIMIT 1
+"""
+
+# Enabled, non-manager accounts anywhere under the login MCC; the only
+# accounts whose campaigns discovery can read through that manager.
+CLIENT_ACCOUNTS_QUERY = """
+    SELECT 
+        customer_client.id
+    FROM customer_client 
+    WHERE customer_client.manager = FALSE
+    AND customer_client.status = 'ENABLED'
+"""
+
+# Top-level domains dropped when deriving a company name from a domain.
+COMPANY_DOMAIN_SUFFIXES = (".com", ".io")
+
+# The MCC hierarchy and account metadata change over days, not seconds.
+DISCOVERY_CACHE_TTL = 3600
+_customers_cache: TTLCache = TTLCache(maxsize=1024, ttl=DISCOVERY_CACHE_TTL)
+_details_cache: TTLCache = TTLCache(maxsize=1024, ttl=DISCOVERY_CACHE_TTL)
+_customers_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # loop -> Lock
+
+
+@functools.lru_cache(maxsize=256)
+def _domain_pattern(domains: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile one case-insensitive pattern matching any of the domains."""
+    return re.compile("|".join(map(re.escape, domains)), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_company(domain: str) -> str:
+    """Company name words from a domain, e.g. "www.acme.labs.com" -> "acme labs"."""
+    name = domain.strip().lower().removeprefix("www.")
+    for suffix in COMPANY_DOMAIN_SUFFIXES:
+        name = name.removesuffix(suffix)
+    return name.replace(".", " ")
+
+
+@functools.lru_cache(maxsize=1024)
+def company_usernames(domain: str) -> str:
+    """Comma-separated social handles a company on this domain is likely to use."""
+    company = normalize_company(domain).replace(" ", "")
+    return f"{company},{company}official,{company}inc"
+
 
 class GoogleAdsAccountDiscovery:
     """Google Ads API client for discovering and analyzing accounts."""
@@ -18,8 +110,13 @@ class GoogleAdsAccountDiscovery:
         self.developer_token = os.getenv("GOOGLE_ADS_DEVELOPER_TOKEN")
         self.login_customer_id = os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID")
         
-    async def search_accounts_by_domain(self, domain: str) -> List[Dict]:
-        """Search for Google Ads accounts associated with a domain."""
+    async def search_accounts_by_domain(self, domain: str, max_results: Optional[int] = None) -> List[Dict]:
+        """Search for Google Ads accounts associated with a domain.
+        
+        Args:
+            domain: Domain to look for in enabled campaigns' names and URLs
+            max_results: Stop checking further accounts once this many match
+        """
         
         if not self._has_credentials():
             logger.warning("Google Ads credentials not configured")
@@ -41,70 +138,150 @@ class GoogleAdsAccountDiscovery:
             
             client = GoogleAdsClient.load_from_dict(credentials)
             
-            # Get accessible customer accounts
-            accounts = await self._get_accessible_customers(client)
-            
-            # Filter accounts that might be related to the domain
-            domain_accounts = []
-            for account in accounts:
-                if await self._is_domain_related(client, account, domain):
-                    account_details = await self._get_account_details(client, account)
-                    domain_accounts.append(account_details)
-            
-            return domain_accounts
+            # A fixed pool of workers checks accounts as the listing feeds them in
+            queue: asyncio.Queue = asyncio.Queue()
+            matches: Dict[int, Dict] = {}
+            
+            async def produce() -> None:
+                try:
+                    accounts = await self._get_accessible_customers(client)
+                    for position, account in enumerate(accounts):
+                        await queue.put((position, account))
+                finally:
+                    for _ in range(DISCOVERY_CONCURRENCY):
+                        await queue.put(None)
+            
+            async def consume() -> None:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    # Once enough accounts matched, drain the rest unchecked
+                    if max_results is not None and len(matches) >= max_results:
+                        continue
+                    position, account = item
+                    try:
+                        details = await self._check_and_fetch(client, account, domain)
+                    except Exception as e:
+                        logger.warning(f"Account discovery failed for {account}: {e}")
+                        continue
+                    if details is not None:
+                        matches[position] = details
+            
+            await asyncio.gather(produce(), *(consume() for _ in range(DISCOVERY_CONCURRENCY)))
+            
+            # Keep the accessible-customers order
+            domain_accounts = [matches[position] for position in sorted(matches)]
+            return domain_accounts[:max_results] if max_results is not None else domain_accounts
             
         except Exception as e:
             logger.error(f"Google Ads account search failed: {e}")
             return []
     
+    async def _check_and_fetch(self, client, customer_id: str, domain: str) -> Optional[Dict]:
+        """Return account details if the account is related to the domain, else None."""
+        if not await self._is_domain_related(client, customer_id, domain):
+            return None
+        return await self._get_account_details(client, customer_id)
+    
+    def _search_stream_rows(self, client, customer_id: str, query: str) -> list:
+        """Run a blocking GAQL search_stream and collect its rows."""
+        ga_service = client.get_service("GoogleAdsService")
+        search_request = client.get_type("SearchGoogleAdsStreamRequest")
+        search_request.customer_id = customer_id
+        search_request.query = query
+        
+        return [row for batch in ga_service.search_stream(search_request) for row in batch.results]
+    
+    def _search_rows(self, client, customer_id: str, query: str) -> list:
+        """Run a blocking unary GAQL search and collect its rows.
+
+        Preferred over search_stream for queries that return a handful of
+        rows, where opening and draining a stream costs more than one request.
+        """
+        ga_service = client.get_service("GoogleAdsService")
+        search_request = client.get_type("SearchGoogleAdsRequest")
+        search_request.customer_id = customer_id
+        search_request.query = query
+        
+        return list(ga_service.search(request=search_request))
+    
+    def _search_any(self, client, customer_id: str, query: str, predicate) -> bool:
+        """Run a blocking unary GAQL search, stopping at the first row matching predicate."""
+        ga_service = client.get_service("GoogleAdsService")
+        search_request = client.get_type("SearchGoogleAdsRequest")
+        search_request.customer_id = customer_id
+        search_request.query = query
+        
+        return any(predicate(row) for row in ga_service.search(request=search_request))
+    
     async def _get_accessible_customers(self, client) -> List[str]:
         """Get list of customer accounts accessible with current credentials."""
         
-        try:
-            customer_service = client.get_service("CustomerService")
-            
-            # Get accessible customers
-            accessible_customers = customer_service.list_accessible_customers()
+        cache_key = self.login_customer_id
+        if cache_key in _customers_cache:
+            return list(_customers_cache[cache_key])
+        
+        # Concurrent searches wait for one lookup instead of each issuing their own
+        async with loop_lock(_customers_locks):
+            if cache_key in _customers_cache:
+                return list(_customers_cache[cache_key])
             
-            return [customer.id for customer in accessible_customers.resource_names]
+            try:
+                customer_ids = await self._list_candidate_customers(client)
+                
+            except Exception as e:
+                logger.error(f"Failed to get accessible customers: {e}")
+                return []
             
-        except Exception as e:
-            logger.error(f"Failed to get accessible customers: {e}")
-            return []
+            if customer_ids:
+                _customers_cache[cache_key] = customer_ids
+            return list(customer_ids)
+    
+    async def _list_candidate_customers(self, client) -> List[str]:
+        """List the customer IDs worth checking during discovery.
+        
+        Under a login MCC, one customer_client query returns only enabled
+        client accounts, so manager and cancelled accounts (which have no
+        campaigns to read) never cost a domain check. Without an MCC, or if
+        that query fails, fall back to every directly accessible customer.
+        """
+        if self.login_customer_id:
+            manager_id = self.login_customer_id.replace("-", "")
+            try:
+                rows = await asyncio.to_thread(
+                    self._search_stream_rows, client, manager_id, CLIENT_ACCOUNTS_QUERY
+                )
+                return [str(row.customer_client.id) for row in rows]
+            except Exception as e:
+                logger.warning(f"Client account listing failed, using accessible customers: {e}")
+        
+        customer_service = client.get_service("CustomerService")
+        accessible_customers = await asyncio.to_thread(customer_service.list_accessible_customers)
+        
+        # Resource names look like customers/1234567890
+        return [
+            resource_name.split("/")[-1]
+            for resource_name in accessible_customers.resource_names
+        ]
     
     async def _is_domain_related(self, client, customer_id: str, domain: str) -> bool:
         """Check if a customer account is related to the given domain."""
         
         try:
-            # Search for campaigns that might reference the domain
-            query = f"""
-                SELECT 
-                    campaign.name,
-                    campaign.final_url_suffix,
-                    campaign.tracking_url_template
-                FROM campaign 
-                WHERE campaign.status = 'ENABLED'
-                LIMIT 10
-            """
-            
-            ga_service = client.get_service("GoogleAdsService")
-            search_request = client.get_type("SearchGoogleAdsStreamRequest")
-            search_request.customer_id = customer_id
-            search_request.query = query
+            # One compiled scan per field, no lowercased copies per row
+            search = _domain_pattern((domain,)).search
             
-            response = ga_service.search_stream(search_request)
+            def references_domain(row) -> bool:
+                campaign = row.campaign
+                return bool(search(campaign.name) or
+                            search(campaign.final_url_suffix or "") or
+                            search(campaign.tracking_url_template or ""))
             
-            # Check if any campaigns reference the domain
-            for batch in response:
-                for row in batch.results:
-                    campaign_name = row.campaign.name.lower()
-                    
-                    if (domain.lower() in campaign_name or
-                        domain.lower() in (row.campaign.final_url_suffix or "") or
-                        domain.lower() in (row.campaign.tracking_url_template or "")):
-                        return True
-            
-            return False
+            # The Google Ads client blocks on gRPC, so stream off the event loop
+            return await asyncio.to_thread(
+                self._search_any, client, customer_id, DOMAIN_CAMPAIGNS_QUERY, references_domain
+            )
             
         except Exception as e:
             logger.warning(f"Domain relation check failed for {customer_id}: {e}")
@@ -113,47 +290,57 @@ class GoogleAdsAccountDiscovery:
     async def _get_account_details(self, client, customer_id: str) -> Dict:
         """Get detailed information about a Google Ads account."""
         
+        # Keyed by day so a cached 30-day spend window never spans two days
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=30)
+        cache_key = (customer_id, end_date)
+        
+        if cache_key in _details_cache:
+            return copy.copy(_details_cache[cache_key])
+        
         try:
-            # Get customer information
-            query = f"""
-                SELECT 
-                    customer.descriptive_name,
-                    customer.currency_code,
-                    customer.time_zone,
-                    customer.status
-                FROM customer
-                LIMIT 1
-            """
-            
-            ga_service = client.get_service("GoogleAdsService")
-            search_request = client.get_type("SearchGoogleAdsStreamRequest")
-            search_request.customer_id = customer_id
-            search_request.query = query
+            # Customer fields and last 30 days campaign spend in one round trip;
+            # the customer columns repeat on every campaign row.
+            query = ACCOUNT_DETAILS_QUERY.format(start_date=start_date, end_date=end_date)
+            
+            try:
+                rows = await asyncio.to_thread(self._search_stream_rows, client, customer_id, query)
+            except Exception as e:
+                logger.warning(f"Failed to get campaigns summary: {e}")
+                rows = []
+            
+            # Sum integer micros and convert to currency once
+            total_micros = 0
+            campaign_ids = set()
             
-            response = ga_service.search_stream(search_request)
+            for row in rows:
+                campaign_ids.add(row.campaign.id)
+                total_micros += row.metrics.cost_micros
             
-            customer_info = None
-            for batch in response:
-                for row in batch.results:
-                    customer_info = row.customer
-                    break
+            if rows:
+                customer_info = rows[0].customer
+            else:
+                # No campaign rows to carry the customer fields; ask for them directly
+                rows = await asyncio.to_thread(
+                    self._search_rows, client, customer_id, CUSTOMER_INFO_QUERY
+                )
+                customer_info = rows[0].customer if rows else None
             
             if not customer_info:
                 return {}
             
-            # Get campaign count and spend
-            campaigns_data = await self._get_campaigns_summary(client, customer_id)
-            
-            return {
+            details = {
                 "account_id": customer_id,
                 "account_name": customer_info.descriptive_name,
                 "currency": customer_info.currency_code,
                 "timezone": customer_info.time_zone,
                 "status": customer_info.status.name.lower(),
-                "campaigns_found": campaigns_data["count"],
-                "total_spend": campaigns_data["spend"],
+                "campaigns_found": len(campaign_ids),
+                "total_spend": round(total_micros / 1_000_000, 2),
                 "access_level": "full_access"
             }
+            _details_cache[cache_key] = details
+            return copy.copy(details)
             
         except Exception as e:
             logger.error(f"Failed to get account details for {customer_id}: {e}")
@@ -165,50 +352,6 @@ class GoogleAdsAccountDiscovery:
                 "access_level": "limited"
             }
     
-    async def _get_campaigns_summary(self, client, customer_id: str) -> Dict:
-        """Get summary of campaigns for an account."""
-        
-        try:
-            # Get last 30 days performance
-            end_date = datetime.now().date()
-            start_date = end_date - timedelta(days=30)
-            
-            query = f"""
-                SELECT 
-                    metrics.cost_micros,
-                    campaign.id,
-                    campaign.name,
-                    campaign.status
-                FROM campaign 
-                WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'
-                AND campaign.status = 'ENABLED'
-            """
-            
-            ga_service = client.get_service("GoogleAdsService")
-            search_request = client.get_type("SearchGoogleAdsStreamRequest")
-            search_request.customer_id = customer_id
-            search_request.query = query
-            
-            response = ga_service.search_stream(search_request)
-            
-            total_spend = 0
-            campaign_count = 0
-            campaign_ids = set()
-            
-            for batch in response:
-                for row in batch.results:
-                    campaign_ids.add(row.campaign.id)
-                    total_spend += row.metrics.cost_micros / 1_000_000  # Convert micros to currency
-            
-            return {
-                "count": len(campaign_ids),
-                "spend": round(total_spend, 2)
-            }
-            
-        except Exception as e:
-            logger.warning(f"Failed to get campaigns summary: {e}")
-            return {"count": 0, "spend": 0.0}
-    
     def _has_credentials(self) -> bool:
         """Check if all required Google Ads credentials are available."""
         return all([
@@ -222,9 +365,26 @@ class GoogleAdsAccountDiscovery:
 class RedditAccountDiscovery:
     """Reddit API client for account discovery."""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.access_token = os.getenv("REDDIT_ACCESS_TOKEN")
         self.user_agent = "Synter/1.0 Account Discovery"
+        # Caller-supplied session; otherwise the shared session is used
+        self.session = session
+        self._owns_session = False
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        if self._owns_session:
+            await self.session.close()
+            self.session = None
+            self._owns_session = False
     
     async def search_accounts_by_domain(self, domain: str) -> List[Dict]:
         """Search for Reddit accounts/communities associated with a domain."""
@@ -233,39 +393,37 @@ class RedditAccountDiscovery:
             return []
         
         try:
-            import aiohttp
+            session = self.session or await get_shared_session()
             
-            # Search for subreddits that might be related to the domain
-            async with aiohttp.ClientSession() as session:
-                # Search for the company/brand subreddit
-                search_url = f"https://oauth.reddit.com/subreddits/search"
-                headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                    "User-Agent": self.user_agent
-                }
-                
-                params = {
-                    "q": domain.replace('.com', '').replace('.', ' '),
-                    "limit": 5,
-                    "type": "subreddit"
-                }
-                
-                async with session.get(search_url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        accounts = []
-                        for subreddit in data.get("data", {}).get("children", []):
-                            sub_data = subreddit["data"]
-                            accounts.append({
-                                "account_id": sub_data["name"],
-                                "account_name": f"r/{sub_data['display_name']}",
-                                "subscribers": sub_data.get("subscribers", 0),
-                                "status": "community",
-                                "access_level": "community_advertising"
-                            })
-                        
-                        return accounts
+            # Search for the company/brand subreddit
+            search_url = f"https://oauth.reddit.com/subreddits/search"
+            headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "User-Agent": self.user_agent
+            }
+            
+            params = {
+                "q": normalize_company(domain),
+                "limit": 5,
+                "type": "subreddit"
+            }
+            
+            async with session.get(search_url, headers=headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    accounts = []
+                    for subreddit in data.get("data", {}).get("children", []):
+                        sub_data = subreddit["data"]
+                        accounts.append({
+                            "account_id": sub_data["name"],
+                            "account_name": f"r/{sub_data['display_name']}",
+                            "subscribers": sub_data.get("subscribers", 0),
+                            "status": "community",
+                            "access_level": "community_advertising"
+                        })
+                    
+                    return accounts
             
             return []
             
@@ -277,8 +435,25 @@ class RedditAccountDiscovery:
 class XAccountDiscovery:
     """X (Twitter) API client for account discovery."""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
+        # Caller-supplied session; otherwise the shared session is used
+        self.session = session
+        self._owns_session = False
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        if self._owns_session:
+            await self.session.close()
+            self.session = None
+            self._owns_session = False
     
     async def search_accounts_by_domain(self, domain: str) -> List[Dict]:
         """Search for X accounts associated with a domain."""
@@ -287,38 +462,35 @@ class XAccountDiscovery:
             return []
         
         try:
-            import aiohttp
+            session = self.session or await get_shared_session()
             
-            # Search for Twitter accounts related to the domain
-            company_name = domain.replace('.com', '').replace('.', '')
+            search_url = "https://api.twitter.com/2/users/by"
+            headers = {
+                "Authorization": f"Bearer {self.bearer_token}"
+            }
             
-            async with aiohttp.ClientSession() as session:
-                search_url = "https://api.twitter.com/2/users/by"
-                headers = {
-                    "Authorization": f"Bearer {self.bearer_token}"
-                }
-                
-                params = {
-                    "usernames": f"{company_name},{company_name}official,{company_name}inc",
-                    "user.fields": "public_metrics,verified,description"
-                }
-                
-                async with session.get(search_url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        accounts = []
-                        for user in data.get("data", []):
-                            accounts.append({
-                                "account_id": user["id"],
-                                "account_name": f"@{user['username']}",
-                                "followers": user.get("public_metrics", {}).get("followers_count", 0),
-                                "verified": user.get("verified", False),
-                                "status": "active",
-                                "access_level": "basic_access"
-                            })
-                        
-                        return accounts
+            params = {
+                # Search for Twitter accounts related to the domain
+                "usernames": company_usernames(domain),
+                "user.fields": "public_metrics,verified,description"
+            }
+            
+            async with session.get(search_url, headers=headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    accounts = []
+                    for user in data.get("data", []):
+                        accounts.append({
+                            "account_id": user["id"],
+                            "account_name": f"@{user['username']}",
+                            "followers": user.get("public_metrics", {}).get("followers_count", 0),
+                            "verified": user.get("verified", False),
+                            "status": "active",
+                            "access_level": "basic_access"
+                        })
+                    
+                    return accounts
             
             return []
             
@@ -0,0 +1,50 @@
+"""Helpers shared by the ad platform integrations and the ETL pipeline."""
+
+import asyncio
+import weakref
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+async def single_flight(
+    inflight: Dict[Hashable, "asyncio.Future[T]"],
+    key: Hashable,
+    fetch: Callable[[], Awaitable[T]],
+) -> T:
+    """Await the in-flight fetch for key, starting it with fetch() if there is none.
+
+    Concurrent callers with the same key share one request. The entry is
+    dropped from ``inflight`` once the fetch finishes, so later calls fetch
+    again.
+    """
+    future = inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        inflight[key] = future
+        future.add_done_callback(lambda _: inflight.pop(key, None))
+    # Shielded so one cancelled caller does not cancel the others' fetch
+    return await asyncio.shield(future)
+
+
+def loop_lock(locks: weakref.WeakKeyDictionary) -> asyncio.Lock:
+    """The lock in locks for the running event loop, created on first use.
+
+    An asyncio.Lock binds to the first loop that contends on it, so a
+    module-level lock breaks once a later asyncio.run contends again. Keying
+    by loop gives each loop its own lock, dropped when the loop goes away.
+    """
+    loop = asyncio.get_running_loop()
+    lock = locks.get(loop)
+    if lock is None:
+        lock = locks[loop] = asyncio.Lock()
+    return lock
+
+
+def ratio(numerator: np.ndarray, denominator: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """numerator / denominator * scale rounded to 2 places, 0 where denominator is 0."""
+    out = np.zeros(len(numerator))
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return np.round(out * scale, 2)
@@ -0,0 +1,38 @@
+"""Process-wide aiohttp session shared by the ad platform integrations."""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Keep-alive HTTP session for the integration clients.
+
+    Reusing one session keeps TCP/TLS connections and DNS lookups warm
+    across clients and calls instead of handshaking on every run. A session
+    is bound to its event loop, so a new one is made when the loop changes
+    (e.g. successive asyncio.run calls from the CLI).
+    """
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.closed or _shared_session_loop is not loop:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60
+            )
+        )
+        _shared_session_loop = loop
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared session, e.g. on application shutdown."""
+    global _shared_session, _shared_session_loop
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
@@ -1,48 +1,172 @@
 """LinkedIn Marketing API integration for ad performance data."""
 
+import importlib.util
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-import aiohttp
+import random
+import time
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Any, AsyncIterator, Iterable, Tuple
 import asyncio
+import httpx
+import numpy as np
+import orjson
+from prometheus_client import Histogram
+
+from .helpers import ratio, single_flight
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Analytics requests in flight at once, within LinkedIn's per-app throttle.
+ANALYTICS_CONCURRENCY = 8
+
+# HTTP/2 multiplexes the concurrent analytics calls over one connection; it
+# needs the optional h2 package (httpx[http2]), otherwise httpx uses HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Rate limits (429) and transient upstream failures are retried with
+# exponential backoff plus full jitter, honouring Retry-After when sent.
+MAX_REQUEST_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Time to response headers per endpoint, for spotting throttling
+REQUEST_SECONDS = Histogram(
+    "linkedin_api_request_seconds", "LinkedIn API request latency", ["endpoint"]
+)
+
+
+def _analytics_row(element: Dict[str, Any], default_date: str) -> Tuple[str, Any, Any, Any, Any]:
+    """Pull (date, impressions, clicks, spend, conversions) from one analytics element."""
+    # LinkedIn returns data with dateRange
+    start = element.get("dateRange", {}).get("start", {})
+    if start:
+        date_str = f"{start.get('year')}-{start.get('month'):02d}-{start.get('day'):02d}"
+    else:
+        date_str = default_date
+    
+    return (
+        date_str,
+        element.get("impressions", 0),
+        element.get("clicks", 0),
+        element.get("costInUsd", 0),
+        element.get("externalWebsiteConversions", 0),
+    )
+
+
+class _AsyncBytesReader:
+    """Async file-like view over an httpx byte stream, as ijson expects."""
+    
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0), and only b"" at the end may signal EOF
+        if size == 0:
+            return b""
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
 
 class LinkedInAdsClient:
     """LinkedIn Marketing API client for campaign and performance data."""
     
-    def __init__(self):
+    def __init__(self, session: Optional[httpx.AsyncClient] = None):
         """Initialize LinkedIn Ads client."""
         self.client_id = os.getenv("LINKEDIN_CLIENT_ID")
         self.client_secret = os.getenv("LINKEDIN_CLIENT_SECRET") 
         self.access_token = os.getenv("LINKEDIN_ACCESS_TOKEN")
         self.base_url = "https://api.linkedin.com/rest"
         self.api_version = "202311"
+        # A caller-supplied client is shared and left open on exit; it must
+        # carry the base URL and headers itself
+        self.session = session
+        self._owns_session = session is None
+        # Analytics fetches in flight, so concurrent identical calls share one
+        self._inflight: Dict[Tuple[str, str, str], "asyncio.Future[Dict[str, Any]]"] = {}
         
         if not all([self.client_id, self.client_secret]):
             logger.warning("LinkedIn API credentials not configured - using mock mode")
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        # Mock mode never touches the network, so skip building a client
+        # (and its TLS context); request headers are fixed for the client's life
+        if self.session is None and self.access_token:
+            self.session = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                limits=HTTP_LIMITS,
+            )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if hasattr(self, 'session'):
-            await self.session.close()
+        if self.session and self._owns_session:
+            await self.session.aclose()
     
     def _get_headers(self) -> Dict[str, str]:
         """Get API request headers with authentication."""
         return {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip",
             "LinkedIn-Version": self.api_version,
             "X-Restli-Protocol-Version": "2.0.0"
         }
     
+    @asynccontextmanager
+    async def _get(self, path: str, params: Dict[str, Any]) -> AsyncIterator[httpx.Response]:
+        """GET path as a streamed response, retrying rate limits and transient errors.
+        
+        The final response is yielded whatever its status, so callers keep
+        their own status handling; the body is read or streamed inside the block.
+        """
+        for attempt in range(1, MAX_REQUEST_ATTEMPTS + 1):
+            last_attempt = attempt == MAX_REQUEST_ATTEMPTS
+            started = time.perf_counter()
+            try:
+                response = await self.session.send(
+                    self.session.build_request("GET", path, params=params), stream=True
+                )
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                logger.warning(f"LinkedIn {path} request failed (attempt {attempt}): {e}")
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+            REQUEST_SECONDS.labels(endpoint=path).observe(time.perf_counter() - started)
+            
+            if response.status_code not in RETRYABLE_STATUSES or last_attempt:
+                break
+            logger.warning(f"LinkedIn {path} returned {response.status_code} (attempt {attempt})")
+            await response.aclose()
+            await asyncio.sleep(self._retry_delay(attempt, response.headers.get("Retry-After")))
+        
+        try:
+            yield response
+        finally:
+            await response.aclose()
+    
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next attempt."""
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), RETRY_MAX_DELAY)
+        return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+    
     async def get_ad_accounts(self) -> List[Dict[str, Any]]:
         """Get LinkedIn ad accounts (sponsored accounts)."""
         if not self.access_token:
@@ -57,19 +181,18 @@ class LinkedInAdsClient:
             ]
         
         try:
-            url = f"{self.base_url}/adAccounts"
             params = {
                 "q": "search",
                 "search.status.values[0]": "ACTIVE",
                 "fields": "id,name,type,status"
             }
             
-            async with self.session.get(url, headers=self._get_headers(), params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
+            async with self._get("/adAccounts", params) as response:
+                if response.status_code == 200:
+                    data = orjson.loads(await response.aread())
                     return data.get("elements", [])
                 else:
-                    logger.error(f"Failed to fetch LinkedIn ad accounts: {response.status}")
+                    logger.error(f"Failed to fetch LinkedIn ad accounts: {response.status_code}")
                     return []
                     
         except Exception as e:
@@ -91,7 +214,6 @@ class LinkedInAdsClient:
             ]
         
         try:
-            url = f"{self.base_url}/campaigns"
             params = {
                 "q": "search",
                 "search.account.values[0]": account_id,
@@ -99,12 +221,12 @@ class LinkedInAdsClient:
                 "fields": "id,name,status,type,account"
             }
             
-            async with self.session.get(url, headers=self._get_headers(), params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
+            async with self._get("/campaigns", params) as response:
+                if response.status_code == 200:
+                    data = orjson.loads(await response.aread())
                     return data.get("elements", [])
                 else:
-                    logger.error(f"Failed to fetch LinkedIn campaigns: {response.status}")
+                    logger.error(f"Failed to fetch LinkedIn campaigns: {response.status_code}")
                     return []
                     
         except Exception as e:
@@ -112,34 +234,54 @@ class LinkedInAdsClient:
             return []
     
     async def get_campaign_analytics(self, campaign_id: str, start_date: str, end_date: str) -> Dict[str, Any]:
-        """Get analytics data for a LinkedIn campaign."""
+        """Get analytics data for a LinkedIn campaign.
+        
+        Concurrent calls for the same campaign and window share one request.
+        """
         if not self.access_token:
             logger.info("LinkedIn access token not configured - returning mock analytics")
             return self._generate_mock_analytics(start_date, end_date)
         
+        key = (campaign_id, start_date, end_date)
+        return await single_flight(
+            self._inflight, key,
+            lambda: self._fetch_campaign_analytics(campaign_id, start_date, end_date),
+        )
+    
+    async def _fetch_campaign_analytics(self, campaign_id: str, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Fetch one campaign's daily analytics, falling back to mock data on failure."""
         try:
-            url = f"{self.base_url}/analyticsFinderStats"
+            start = date.fromisoformat(start_date)
+            end = date.fromisoformat(end_date)
             params = {
                 "q": "analytics",
                 "pivot": "CAMPAIGN",
                 "campaigns[0]": campaign_id,
-                "dateRange.start.day": int(start_date.split("-")[2]),
-                "dateRange.start.month": int(start_date.split("-")[1]),
-                "dateRange.start.year": int(start_date.split("-")[0]),
-                "dateRange.end.day": int(end_date.split("-")[2]),
-                "dateRange.end.month": int(end_date.split("-")[1]),
-                "dateRange.end.year": int(end_date.split("-")[0]),
+                "dateRange.start.day": start.day,
+                "dateRange.start.month": start.month,
+                "dateRange.start.year": start.year,
+                "dateRange.end.day": end.day,
+                "dateRange.end.month": end.month,
+                "dateRange.end.year": end.year,
                 "timeGranularity": "DAILY",
                 "fields": "impressions,clicks,costInUsd,externalWebsiteConversions"
             }
             
-            async with self.session.get(url, headers=self._get_headers(), params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._process_analytics_response(data, start_date, end_date)
-                else:
-                    logger.error(f"Failed to fetch LinkedIn analytics: {response.status}")
+            async with self._get("/analyticsFinderStats", params) as response:
+                if response.status_code != 200:
+                    logger.error(f"Failed to fetch LinkedIn analytics: {response.status_code}")
                     return self._generate_mock_analytics(start_date, end_date)
+                
+                if not IJSON_AVAILABLE:
+                    data = orjson.loads(await response.aread())
+                    return self._process_analytics_response(data, start_date, end_date)
+                
+                # Decode elements as bytes arrive; only one element is held at a time
+                elements = ijson.items(
+                    _AsyncBytesReader(response.aiter_bytes()), "elements.item", use_float=True
+                )
+                rows = [_analytics_row(element, start_date) async for element in elements]
+                return self._daily_metrics(rows)
                     
         except Exception as e:
             logger.error(f"Error fetching LinkedIn analytics: {e}")
@@ -147,78 +289,75 @@ class LinkedInAdsClient:
     
     def _process_analytics_response(self, data: Dict[str, Any], start_date: str, end_date: str) -> Dict[str, Any]:
         """Process LinkedIn analytics API response into daily metrics."""
-        daily_metrics = {}
+        rows = [_analytics_row(element, start_date) for element in data.get("elements", [])]
+        return self._daily_metrics(rows)
+    
+    def _daily_metrics(self, rows: Iterable[Tuple[str, Any, Any, Any, Any]]) -> Dict[str, Any]:
+        """Turn (date, impressions, clicks, spend, conversions) rows into daily metrics."""
+        columns = list(zip(*rows))
+        if not columns:
+            return {}
+        dates, impressions, clicks, spend, conversions = (list(column) for column in columns)
         
-        elements = data.get("elements", [])
+        # Derived ratios for every day at once
+        impressions_arr = np.asarray(impressions, dtype=np.float64)
+        clicks_arr = np.asarray(clicks, dtype=np.float64)
+        spend_arr = np.asarray(spend, dtype=np.float64)
+        conversions_arr = np.asarray(conversions, dtype=np.float64)
         
-        for element in elements:
-            # LinkedIn returns data with dateRange
-            date_range = element.get("dateRange", {})
-            start = date_range.get("start", {})
-            
-            if start:
-                date_str = f"{start.get('year')}-{start.get('month'):02d}-{start.get('day'):02d}"
-            else:
-                date_str = start_date
-            
-            # Extract metrics
-            impressions = element.get("impressions", 0)
-            clicks = element.get("clicks", 0)
-            cost_usd = element.get("costInUsd", 0)
-            conversions = element.get("externalWebsiteConversions", 0)
-            
-            daily_metrics[date_str] = {
-                "impressions": impressions,
-                "clicks": clicks,
-                "spend": cost_usd,
-                "conversions": conversions,
-                "ctr": round((clicks / impressions * 100), 2) if impressions > 0 else 0,
-                "cpc": round((cost_usd / clicks), 2) if clicks > 0 else 0,
-                "cpm": round((cost_usd / impressions * 1000), 2) if impressions > 0 else 0,
-                "conversion_rate": round((conversions / clicks * 100), 2) if clicks > 0 else 0,
-                "cost_per_conversion": round((cost_usd / conversions), 2) if conversions > 0 else 0
-            }
+        metric_columns = {
+            "impressions": impressions,
+            "clicks": clicks,
+            "spend": spend,
+            "conversions": conversions,
+            "ctr": ratio(clicks_arr, impressions_arr, 100).tolist(),
+            "cpc": ratio(spend_arr, clicks_arr).tolist(),
+            "cpm": ratio(spend_arr, impressions_arr, 1000).tolist(),
+            "conversion_rate": ratio(conversions_arr, clicks_arr, 100).tolist(),
+            "cost_per_conversion": ratio(spend_arr, conversions_arr).tolist(),
+        }
         
-        return daily_metrics
+        return {
+            date_str: dict(zip(metric_columns, day_values))
+            for date_str, *day_values in zip(dates, *metric_columns.values())
+        }
     
     def _generate_mock_analytics(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """Generate mock analytics data for testing."""
-        daily_metrics = {}
+        days = np.arange(
+            np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1, dtype="datetime64[D]"
+        )
         
-        current_date = datetime.strptime(start_date, "%Y-%m-%d")
-        end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
+        # Generate realistic mock data with some variation
+        base_impressions = 5000
+        base_clicks = 150
+        base_spend = 300.0
+        base_conversions = 8
         
-        while current_date <= end_date_obj:
-            date_str = current_date.strftime("%Y-%m-%d")
-            
-            # Generate realistic mock data with some variation
-            base_impressions = 5000
-            base_clicks = 150
-            base_spend = 300.0
-            base_conversions = 8
-            
-            # Add daily variation
-            day_factor = 1 + (current_date.day % 7) * 0.1
-            impressions = int(base_impressions * day_factor)
-            clicks = int(base_clicks * day_factor)
-            spend = round(base_spend * day_factor, 2)
-            conversions = int(base_conversions * day_factor)
-            
-            daily_metrics[date_str] = {
-                "impressions": impressions,
-                "clicks": clicks,
-                "spend": spend,
-                "conversions": conversions,
-                "ctr": round((clicks / impressions * 100), 2) if impressions > 0 else 0,
-                "cpc": round((spend / clicks), 2) if clicks > 0 else 0,
-                "cpm": round((spend / impressions * 1000), 2) if impressions > 0 else 0,
-                "conversion_rate": round((conversions / clicks * 100), 2) if clicks > 0 else 0,
-                "cost_per_conversion": round((spend / conversions), 2) if conversions > 0 else 0
-            }
-            
-            current_date += timedelta(days=1)
+        # Add daily variation, keyed on the day of the month
+        day_of_month = (days - days.astype("datetime64[M]")).astype(np.int64) + 1
+        day_factor = 1 + (day_of_month % 7) * 0.1
+        impressions = (base_impressions * day_factor).astype(np.int64)
+        clicks = (base_clicks * day_factor).astype(np.int64)
+        spend = np.round(base_spend * day_factor, 2)
+        conversions = (base_conversions * day_factor).astype(np.int64)
         
-        return daily_metrics
+        metric_columns = {
+            "impressions": impressions.tolist(),
+            "clicks": clicks.tolist(),
+            "spend": spend.tolist(),
+            "conversions": conversions.tolist(),
+            "ctr": ratio(clicks, impressions, 100).tolist(),
+            "cpc": ratio(spend, clicks).tolist(),
+            "cpm": ratio(spend, impressions, 1000).tolist(),
+            "conversion_rate": ratio(conversions, clicks, 100).tolist(),
+            "cost_per_conversion": ratio(spend, conversions).tolist(),
+        }
+        
+        return {
+            date_str: dict(zip(metric_columns, day_values))
+            for date_str, *day_values in zip(days.astype(str).tolist(), *metric_columns.values())
+        }
     
     async def test_connection(self) -> Dict[str, Any]:
         """Test LinkedIn API connection and return status."""
@@ -231,12 +370,11 @@ class LinkedInAdsClient:
         
         try:
             # Test with a simple profile request
-            url = f"{self.base_url}/people/~"
             params = {"fields": "id,localizedFirstName,localizedLastName"}
             
-            async with self.session.get(url, headers=self._get_headers(), params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
+            async with self._get("/people/~", params) as response:
+                if response.status_code == 200:
+                    data = orjson.loads(await response.aread())
                     return {
                         "connected": True,
                         "status": "Successfully connected to LinkedIn Marketing API",
@@ -246,7 +384,7 @@ class LinkedInAdsClient:
                 else:
                     return {
                         "connected": False,
-                        "status": f"API connection failed with status {response.status}",
+                        "status": f"API connection failed with status {response.status_code}",
                         "mode": "mock"
                     }
         except Exception as e:
@@ -266,26 +404,41 @@ async def test_linkedin_connection():
 
 async def get_linkedin_campaign_data(days_back: int = 7):
     """Get LinkedIn campaign data for testing."""
+    now = datetime.now()
+    start_date = (now - timedelta(days=days_back)).strftime("%Y-%m-%d")
+    end_date = now.strftime("%Y-%m-%d")
+    
     async with LinkedInAdsClient() as client:
         accounts = await client.get_ad_accounts()
         
-        results = []
+        pairs = []
         for account in accounts:
-            campaigns = await client.get_campaigns(account["id"])
+            for campaign in await client.get_campaigns(account["id"]):
+                pairs.append((account, campaign))
+        
+        semaphore = asyncio.Semaphore(ANALYTICS_CONCURRENCY)
+        
+        async def fetch_analytics(campaign_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await client.get_campaign_analytics(campaign_id, start_date, end_date)
+        
+        # Fetch every campaign's analytics concurrently, a bounded number at a time
+        analytics_list = await asyncio.gather(
+            *(fetch_analytics(campaign["id"]) for _, campaign in pairs),
+            return_exceptions=True,
+        )
+        
+        results = []
+        for (account, campaign), analytics in zip(pairs, analytics_list):
+            if isinstance(analytics, Exception):
+                logger.error(f"Failed to get analytics for LinkedIn campaign {campaign['id']}: {analytics}")
+                continue
             
-            for campaign in campaigns:
-                start_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
-                end_date = datetime.now().strftime("%Y-%m-%d")
-                
-                analytics = await client.get_campaign_analytics(
-                    campaign["id"], start_date, end_date
-                )
-                
-                results.append({
-                    "account": account,
-                    "campaign": campaign,
-                    "analytics": analytics
-                })
+            results.append({
+                "account": account,
+                "campaign": campaign,
+                "analytics": analytics
+            })
         
         return results
 
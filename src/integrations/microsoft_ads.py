@@ -4,6 +4,8 @@ import asyncio
 import json
 import logging
 import os
+import random
+import zlib
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlencode
@@ -11,8 +13,36 @@ from urllib.parse import urlencode
 import aiohttp
 from pydantic import BaseModel
 
+from .helpers import single_flight
+from .http_session import get_shared_session
+
 logger = logging.getLogger(__name__)
 
+# Campaign metrics requests in flight at once, to stay within API rate limits.
+METRICS_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "10"))
+
+
+def _mock_row(seed_key: str) -> Tuple[int, int, float, int]:
+    """Deterministic mock (impressions, clicks, spend, conversions) for a key.
+
+    Seeds a private generator from a stable CRC32, so values match across
+    processes (str hash() is randomized) and the global random state is untouched.
+    """
+    rng = random.Random(zlib.crc32(seed_key.encode()))
+    impressions = rng.randint(8000, 25000)
+    clicks = rng.randint(300, 1200)
+    spend = round(rng.uniform(400, 2000), 2)
+    conversions = rng.randint(15, 80)
+    return impressions, clicks, spend, conversions
+
+
+def _derived_ratios(impressions: int, clicks: int, spend: float, conversions: int) -> Tuple[float, float, float]:
+    """(ctr, cpc, conversion_rate) for one campaign row, rounded to 2 places."""
+    ctr = (clicks / impressions * 100) if impressions > 0 else 0.0
+    cpc = (spend / clicks) if clicks > 0 else 0.0
+    conversion_rate = (conversions / clicks * 100) if clicks > 0 else 0.0
+    return round(ctr, 2), round(cpc, 2), round(conversion_rate, 2)
+
 
 class MicrosoftAdMetrics(BaseModel):
     """Microsoft Ads metrics data model."""
@@ -33,27 +63,30 @@ class MicrosoftAdsClient:
     
     BASE_URL = "https://api.bingads.microsoft.com"
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.developer_token = os.getenv("MICROSOFT_ADS_DEVELOPER_TOKEN")
         self.client_id = os.getenv("MICROSOFT_ADS_CLIENT_ID")
         self.client_secret = os.getenv("MICROSOFT_ADS_CLIENT_SECRET")
         self.customer_id = os.getenv("MICROSOFT_ADS_CUSTOMER_ID")
         self.access_token = None
-        self.session = None
+        # Caller-supplied session, else the process-wide one; neither is
+        # closed on exit
+        self.session = session
+        # Metrics fetches in flight, so concurrent identical calls share one
+        self._inflight: Dict[Tuple[str, str, str], "asyncio.Future[Optional[MicrosoftAdMetrics]]"] = {}
         
         if not self.developer_token:
             raise ValueError("Microsoft Ads developer token not configured")
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = await get_shared_session()
         await self.authenticate()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit; the session outlives the client."""
     
     async def authenticate(self) -> bool:
         """Authenticate with Microsoft Ads API using OAuth2."""
@@ -153,25 +186,15 @@ class MicrosoftAdsClient:
                 "Microsoft Display - Remarketing"
             ]
             
-            import random
-            from datetime import datetime, timedelta
-            
             if not start_date:
                 start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
             if not end_date:
                 end_date = datetime.now().strftime("%Y-%m-%d")
             
             for i, campaign_name in enumerate(campaign_names, 1):
-                random.seed(hash(campaign_name))  # Deterministic data
-                
-                impressions = random.randint(8000, 25000)
-                clicks = random.randint(300, 1200) 
-                spend = round(random.uniform(400, 2000), 2)
-                conversions = random.randint(15, 80)
+                impressions, clicks, spend, conversions = _mock_row(campaign_name)
                 
-                ctr = (clicks / impressions * 100) if impressions > 0 else 0
-                cpc = (spend / clicks) if clicks > 0 else 0
-                conversion_rate = (conversions / clicks * 100) if clicks > 0 else 0
+                ctr, cpc, conversion_rate = _derived_ratios(impressions, clicks, spend, conversions)
                 
                 mock_campaigns.append(MicrosoftAdMetrics(
                     campaign_id=f"ms_camp_{i}",
@@ -180,9 +203,9 @@ class MicrosoftAdsClient:
                     clicks=clicks,
                     spend=spend,
                     conversions=conversions,
-                    ctr=round(ctr, 2),
-                    cpc=round(cpc, 2),
-                    conversion_rate=round(conversion_rate, 2),
+                    ctr=ctr,
+                    cpc=cpc,
+                    conversion_rate=conversion_rate,
                     date=start_date
                 ))
             
@@ -230,7 +253,23 @@ class MicrosoftAdsClient:
         start_date: datetime,
         end_date: datetime
     ) -> Optional[MicrosoftAdMetrics]:
-        """Get metrics for a specific campaign."""
+        """Get metrics for a specific campaign.
+        
+        Concurrent calls for the same campaign and date range share one request.
+        """
+        key = (campaign_id, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+        return await single_flight(
+            self._inflight, key,
+            lambda: self._fetch_campaign_metrics(campaign_id, start_date, end_date),
+        )
+    
+    async def _fetch_campaign_metrics(
+        self,
+        campaign_id: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[MicrosoftAdMetrics]:
+        """Fetch one campaign's metrics, or None on failure."""
         if not self.access_token:
             logger.warning("⚠️ No access token available")
             return None
@@ -238,17 +277,9 @@ class MicrosoftAdsClient:
         try:
             # Mock realistic Microsoft Ads performance data
             # In production, this would call the actual Bing Ads Reporting API
-            import random
-            random.seed(hash(campaign_id))  # Deterministic per campaign
+            impressions, clicks, spend, conversions = _mock_row(campaign_id)
             
-            impressions = random.randint(8000, 25000)
-            clicks = random.randint(300, 1200) 
-            spend = round(random.uniform(400, 2000), 2)
-            conversions = random.randint(15, 80)
-            
-            ctr = (clicks / impressions * 100) if impressions > 0 else 0
-            cpc = (spend / clicks) if clicks > 0 else 0
-            conversion_rate = (conversions / clicks * 100) if clicks > 0 else 0
+            ctr, cpc, conversion_rate = _derived_ratios(impressions, clicks, spend, conversions)
             
             return MicrosoftAdMetrics(
                 campaign_id=campaign_id,
@@ -257,9 +288,9 @@ class MicrosoftAdsClient:
                 clicks=clicks,
                 spend=spend,
                 conversions=conversions,
-                ctr=round(ctr, 2),
-                cpc=round(cpc, 2),
-                conversion_rate=round(conversion_rate, 2),
+                ctr=ctr,
+                cpc=cpc,
+                conversion_rate=conversion_rate,
                 date=start_date.strftime('%Y-%m-%d')
             )
                     
@@ -280,18 +311,21 @@ class MicrosoftAdsClient:
             logger.warning("⚠️ No Microsoft campaigns found")
             return []
         
+        # Fetch every campaign concurrently, a bounded number at a time
+        semaphore = asyncio.Semaphore(METRICS_CONCURRENCY)
+        
+        async def fetch(campaign: Dict) -> Tuple[Dict, Optional[MicrosoftAdMetrics]]:
+            async with semaphore:
+                return campaign, await self.get_campaign_metrics(campaign['id'], start_date, end_date)
+        
+        results = await asyncio.gather(*(fetch(campaign) for campaign in campaigns if campaign.get('id')))
+        
         metrics_list = []
-        for campaign in campaigns:
-            campaign_id = campaign.get('id')
-            if campaign_id:
-                metrics = await self.get_campaign_metrics(campaign_id, start_date, end_date)
-                if metrics:
-                    # Update campaign name from campaign data
-                    metrics.campaign_name = campaign.get('name', metrics.campaign_name)
-                    metrics_list.append(metrics)
-                
-                # Add small delay to respect rate limits
-                await asyncio.sleep(0.1)
+        for campaign, metrics in results:
+            if metrics:
+                # Update campaign name from campaign data
+                metrics.campaign_name = campaign.get('name', metrics.campaign_name)
+                metrics_list.append(metrics)
         
         logger.info(f"✅ Retrieved metrics for {len(metrics_list)} Microsoft campaigns")
         return metrics_list
@@ -1,18 +1,49 @@
 """Reddit Ads API integration for campaign data."""
 
 import asyncio
-import json
 import logging
 import os
+import time
+import weakref
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import aiohttp
+import orjson
+from cachetools import TTLCache
 from pydantic import BaseModel
 
+from .helpers import loop_lock, single_flight
+from .http_session import get_shared_session
+
 logger = logging.getLogger(__name__)
 
+# Campaign metrics requests in flight at once, to stay within API rate limits.
+METRICS_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "10"))
+
+# Access tokens are valid for about an hour; reuse them across clients until
+# shortly before they expire, keyed by (client_id, scope).
+TOKEN_SCOPE = "ads_read"
+TOKEN_EXPIRY_SKEW = 60
+_token_cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+_token_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # loop -> Lock
+
+# Campaign lists change rarely, and metrics for days that have closed never
+# change; ranges that include today are always fetched fresh.
+CAMPAIGNS_CACHE_TTL = 300
+CLOSED_METRICS_CACHE_TTL = 86400
+_campaigns_cache: TTLCache = TTLCache(maxsize=1024, ttl=CAMPAIGNS_CACHE_TTL)
+_metrics_cache: TTLCache = TTLCache(maxsize=4096, ttl=CLOSED_METRICS_CACHE_TTL)
+
+
+def _cached_token(key: Tuple[str, str]) -> Optional[str]:
+    """Cached access token for key, or None if missing or about to expire."""
+    cached = _token_cache.get(key)
+    if cached and time.monotonic() < cached[1]:
+        return cached[0]
+    return None
+
 
 class RedditAdMetrics(BaseModel):
     """Reddit Ads metrics data model."""
@@ -33,59 +64,82 @@ class RedditAdsClient:
     
     BASE_URL = "https://ads-api.reddit.com/api/v2.0"
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.client_id = os.getenv("REDDIT_CLIENT_ID")
         self.client_secret = os.getenv("REDDIT_CLIENT_SECRET") 
         self.access_token = None
-        self.session = None
+        # Caller-supplied session, else the process-wide one; neither is
+        # closed on exit
+        self.session = session
+        # Metrics fetches in flight, so concurrent identical calls share one
+        self._inflight: Dict[str, "asyncio.Future[Optional[RedditAdMetrics]]"] = {}
+        self.cache_stats = {"hits": 0, "misses": 0}
         
         if not self.client_id or not self.client_secret:
             raise ValueError("Reddit API credentials not configured")
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = await get_shared_session()
         await self.authenticate()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit; the session outlives the client."""
     
     async def authenticate(self) -> bool:
         """Authenticate with Reddit Ads API using OAuth2 client credentials flow."""
-        try:
-            # Reddit uses basic auth for client credentials
-            auth_headers = {
-                'Authorization': f'Basic {self._encode_credentials()}',
-                'Content-Type': 'application/x-www-form-urlencoded',
-                'User-Agent': 'AI-AdWords/1.0'
-            }
-            
-            auth_data = {
-                'grant_type': 'client_credentials',
-                'scope': 'ads_read'
-            }
+        key = (self.client_id, TOKEN_SCOPE)
+        token = _cached_token(key)
+        if token:
+            self.access_token = token
+            return True
+        
+        # Concurrent first-time callers wait for a single token request
+        async with loop_lock(_token_locks):
+            token = _cached_token(key)
+            if token:
+                self.access_token = token
+                return True
             
-            async with self.session.post(
-                'https://www.reddit.com/api/v1/access_token',
-                headers=auth_headers,
-                data=urlencode(auth_data)
-            ) as response:
-                if response.status == 200:
-                    token_data = await response.json()
-                    self.access_token = token_data.get('access_token')
-                    logger.info("✅ Reddit Ads API authentication successful")
-                    return True
-                else:
-                    error_text = await response.text()
-                    logger.error(f"❌ Reddit auth failed: {response.status} - {error_text}")
-                    return False
-                    
-        except Exception as e:
-            logger.error(f"❌ Reddit authentication error: {e}")
-            return False
+            try:
+                # Reddit uses basic auth for client credentials
+                auth_headers = {
+                    'Authorization': f'Basic {self._encode_credentials()}',
+                    'Content-Type': 'application/x-www-form-urlencoded',
+                    'User-Agent': 'AI-AdWords/1.0'
+                }
+                
+                auth_data = {
+                    'grant_type': 'client_credentials',
+                    'scope': TOKEN_SCOPE
+                }
+                
+                async with self.session.post(
+                    'https://www.reddit.com/api/v1/access_token',
+                    headers=auth_headers,
+                    data=urlencode(auth_data)
+                ) as response:
+                    if response.status == 200:
+                        token_data = orjson.loads(await response.read())
+                        self.access_token = token_data.get('access_token')
+                        if self.access_token:
+                            expires_in = float(token_data.get('expires_in', 3600))
+                            _token_cache[key] = (
+                                self.access_token,
+                                time.monotonic() + expires_in - TOKEN_EXPIRY_SKEW,
+                            )
+                        logger.info("✅ Reddit Ads API authentication successful")
+                        return True
+                    else:
+                        error_text = await response.text()
+                        logger.error(f"❌ Reddit auth failed: {response.status} - {error_text}")
+                        return False
+                        
+            except Exception as e:
+                logger.error(f"❌ Reddit authentication error: {e}")
+                return False
     
     def _encode_credentials(self) -> str:
         """Encode client credentials for basic auth."""
@@ -95,6 +149,12 @@ class RedditAdsClient:
     
     async def get_campaigns(self) -> List[Dict]:
         """Get list of campaigns."""
+        cached = _campaigns_cache.get(self.client_id)
+        if cached is not None:
+            self.cache_stats["hits"] += 1
+            return list(cached)
+        self.cache_stats["misses"] += 1
+        
         if not self.access_token:
             await self.authenticate()
             
@@ -109,8 +169,10 @@ class RedditAdsClient:
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    return data.get('data', [])
+                    data = orjson.loads(await response.read())
+                    campaigns = data.get('data', [])
+                    _campaigns_cache[self.client_id] = campaigns
+                    return list(campaigns)
                 else:
                     logger.error(f"❌ Failed to fetch campaigns: {response.status}")
                     return []
@@ -124,7 +186,34 @@ class RedditAdsClient:
         start_date: datetime,
         end_date: datetime
     ) -> Optional[RedditAdMetrics]:
-        """Get metrics for a specific campaign."""
+        """Get metrics for a specific campaign.
+        
+        Concurrent calls for the same campaign and date range share one request,
+        and ranges that ended before today are served from cache.
+        """
+        key = f"{self.client_id}|{campaign_id}|{start_date:%Y%m%d}|{end_date:%Y%m%d}"
+        cached = _metrics_cache.get(key)
+        if cached is not None:
+            self.cache_stats["hits"] += 1
+            return cached.model_copy()
+        self.cache_stats["misses"] += 1
+        
+        metrics = await single_flight(
+            self._inflight, key,
+            lambda: self._fetch_campaign_metrics(campaign_id, start_date, end_date),
+        )
+        
+        if metrics is not None and end_date.date() < datetime.now().date():
+            _metrics_cache[key] = metrics.model_copy()
+        return metrics
+    
+    async def _fetch_campaign_metrics(
+        self,
+        campaign_id: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[RedditAdMetrics]:
+        """Fetch one campaign's metrics, or None on failure."""
         if not self.access_token:
             await self.authenticate()
         
@@ -146,7 +235,7 @@ class RedditAdsClient:
                 params=params
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     metrics_data = data.get('data', {})
                     
                     # Calculate derived metrics
@@ -192,18 +281,21 @@ class RedditAdsClient:
             logger.warning("⚠️ No Reddit campaigns found")
             return []
         
+        # Fetch every campaign concurrently, a bounded number at a time
+        semaphore = asyncio.Semaphore(METRICS_CONCURRENCY)
+        
+        async def fetch(campaign: Dict) -> Tuple[Dict, Optional[RedditAdMetrics]]:
+            async with semaphore:
+                return campaign, await self.get_campaign_metrics(campaign['id'], start_date, end_date)
+        
+        results = await asyncio.gather(*(fetch(campaign) for campaign in campaigns if campaign.get('id')))
+        
         metrics_list = []
-        for campaign in campaigns:
-            campaign_id = campaign.get('id')
-            if campaign_id:
-                metrics = await self.get_campaign_metrics(campaign_id, start_date, end_date)
-                if metrics:
-                    # Update campaign name from campaign data
-                    metrics.campaign_name = campaign.get('name', metrics.campaign_name)
-                    metrics_list.append(metrics)
-                
-                # Add small delay to respect rate limits
-                await asyncio.sleep(0.1)
+        for campaign, metrics in results:
+            if metrics:
+                # Update campaign name from campaign data
+                metrics.campaign_name = campaign.get('name', metrics.campaign_name)
+                metrics_list.append(metrics)
         
         logger.info(f"✅ Retrieved metrics for {len(metrics_list)} Reddit campaigns")
         return metrics_list
@@ -106,6 +106,23 @@ class TestGoogleAdsClientFactory:
 
         assert "login_customer_id" not in config
 
+    @patch("src.ads.ads_client.BaseGoogleAdsClient.load_from_dict")
+    def test_create_client_without_proto_plus(self, mock_load):
+        """Test client creation can opt out of proto-plus wrapping."""
+        factory = GoogleAdsClientFactory(
+            developer_token="dev_token",
+            refresh_token="refresh_token",
+            client_id="client_id",
+            client_secret="client_secret",
+            use_proto_plus=False,
+        )
+
+        factory.create_client()
+
+        config = mock_load.call_args[0][0]
+
+        assert config["use_proto_plus"] is False
+
     def test_retry_config(self):
         """Test retry configuration parameters."""
         factory = GoogleAdsClientFactory(
@@ -0,0 +1,161 @@
+"""Unit tests for dashboard app module."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from src.dashboard import app
+from src.dashboard.app import _DEMO_DATA, SynterDashboard
+
+
+def _time_series(num_days: int) -> dict:
+    """Columnar daily series like the bundle's time_series."""
+    return {
+        "date": [f"2024-01-{day:02d}" for day in range(1, num_days + 1)],
+        "spend": [100.0] * num_days,
+        "clicks": [10] * num_days,
+    }
+
+
+@pytest.fixture
+def dashboard(monkeypatch):
+    """Dashboard connected to a mocked BigQuery service."""
+    dashboard = SynterDashboard()
+    dashboard.connected = True
+    dashboard.bq_service = Mock()
+    # The cached loader fetches through the module-level instance
+    monkeypatch.setattr(app, "dashboard", dashboard)
+    return dashboard
+
+
+class TestSynterDashboard:
+    """Test SynterDashboard data loading."""
+
+    def test_failed_bundle_serves_demo_data_and_is_not_cached(self, dashboard):
+        """Test a BigQuery failure falls back to demo data without caching it."""
+        dashboard.bq_service.get_dashboard_bundle = AsyncMock(
+            side_effect=RuntimeError("quota exceeded")
+        )
+
+        data = asyncio.run(dashboard.get_dashboard_data(30))
+
+        assert data is _DEMO_DATA
+        assert 30 not in dashboard._l1
+
+    def test_next_load_after_failure_queries_again(self, dashboard):
+        """Test the load after a failure reaches BigQuery and is cached."""
+        kpis = {"total_spend": 10.0}
+        dashboard.bq_service.get_dashboard_bundle = AsyncMock(
+            side_effect=[RuntimeError("quota exceeded"), (kpis, [], {})]
+        )
+
+        asyncio.run(dashboard.get_dashboard_data(30))
+        data = asyncio.run(dashboard.get_dashboard_data(30))
+
+        assert data["kpis"] == kpis
+        assert data["connected"] is True
+        assert dashboard._l1[30] is data
+        assert dashboard.bq_service.get_dashboard_bundle.await_count == 2
+
+
+class TestCompression:
+    """Test response compression."""
+
+    def test_timeseries_stream_is_not_compressed(self, dashboard):
+        """Test NDJSON rows are sent uncompressed so they arrive line by line."""
+        dashboard.bq_service.get_dashboard_bundle = AsyncMock(
+            return_value=({}, [], _time_series(30))
+        )
+        client = TestClient(app.dashboard_app)
+
+        response = client.get("/api/timeseries", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert len(response.text.splitlines()) == 30
+
+    def test_json_is_compressed(self, dashboard):
+        """Test regular JSON responses are still compressed."""
+        dashboard.connected = False
+        client = TestClient(app.dashboard_app)
+
+        response = client.get("/api/data", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+
+
+class TestDataETag:
+    """Test conditional requests on /api/data."""
+
+    def test_matching_etag_returns_304(self, dashboard):
+        """Test a client resending the ETag gets 304 with no body."""
+        dashboard.connected = False
+        client = TestClient(app.dashboard_app)
+
+        first = client.get("/api/data")
+        etag = first.headers["etag"]
+        second = client.get("/api/data", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert etag.startswith('W/"')
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_stale_etag_returns_payload(self, dashboard):
+        """Test a changed payload is sent in full with a new ETag."""
+        dashboard.connected = False
+        client = TestClient(app.dashboard_app)
+        stale_etag = client.get("/api/data").headers["etag"]
+
+        dashboard.connected = True
+        dashboard.bq_service.get_dashboard_bundle = AsyncMock(
+            return_value=({"total_spend": 10.0}, [], {})
+        )
+        response = client.get("/api/data", headers={"If-None-Match": stale_etag})
+
+        assert response.status_code == 200
+        assert response.json()["kpis"]["total_spend"] == 10.0
+        assert response.headers["etag"] != stale_etag
+
+
+class TestTimeSeriesStream:
+    """Test the NDJSON /api/timeseries endpoint."""
+
+    def test_served_from_cached_bundle(self, dashboard):
+        """Test the stream reuses the cached payload instead of a new query."""
+        dashboard.bq_service.get_dashboard_bundle = AsyncMock(
+            return_value=({}, [], _time_series(3))
+        )
+        client = TestClient(app.dashboard_app)
+
+        client.get("/api/data")
+        response = client.get("/api/timeseries")
+
+        lines = [orjson.loads(line) for line in response.text.splitlines()]
+        assert lines[0] == {"date": "2024-01-01", "spend": 100.0, "clicks": 10}
+        assert len(lines) == 3
+        assert dashboard.bq_service.get_dashboard_bundle.await_count == 1
+
+    def test_failed_load_returns_503(self, dashboard):
+        """Test a BigQuery failure is an error, not an empty stream."""
+        dashboard.bq_service.get_dashboard_bundle = AsyncMock(
+            side_effect=RuntimeError("quota exceeded")
+        )
+        client = TestClient(app.dashboard_app)
+
+        response = client.get("/api/timeseries")
+
+        assert response.status_code == 503
+
+    def test_disconnected_returns_empty_stream(self, dashboard):
+        """Test the stream is empty when BigQuery is not configured."""
+        dashboard.connected = False
+        client = TestClient(app.dashboard_app)
+
+        response = client.get("/api/timeseries")
+
+        assert response.status_code == 200
+        assert response.text == ""
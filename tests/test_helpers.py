@@ -0,0 +1,81 @@
+"""Unit tests for integrations helpers module."""
+
+import asyncio
+import weakref
+
+import numpy as np
+
+from src.integrations.helpers import loop_lock, ratio, single_flight
+
+
+class TestSingleFlight:
+    """Test single_flight request sharing."""
+
+    def test_concurrent_callers_share_one_fetch(self):
+        """Test concurrent calls for one key run the fetch once."""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "metrics"
+
+        async def run():
+            inflight = {}
+            results = await asyncio.gather(
+                *(single_flight(inflight, "key", fetch) for _ in range(5))
+            )
+            return results, inflight
+
+        results, inflight = asyncio.run(run())
+
+        assert results == ["metrics"] * 5
+        assert len(calls) == 1
+        assert inflight == {}
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        """Test cancelling one waiter leaves the shared fetch running."""
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "metrics"
+
+        async def run():
+            inflight = {}
+            first = asyncio.ensure_future(single_flight(inflight, "key", fetch))
+            second = asyncio.ensure_future(single_flight(inflight, "key", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second, first.cancelled()
+
+        assert asyncio.run(run()) == ("metrics", True)
+
+
+class TestRatio:
+    """Test ratio."""
+
+    def test_ratio_scales_rounds_and_zeroes_empty_denominators(self):
+        """Test ratios are scaled, rounded to 2 places, and 0 for a 0 denominator."""
+        result = ratio(np.array([1, 2, 5]), np.array([3, 0, 4]), 100)
+
+        assert result.tolist() == [33.33, 0.0, 125.0]
+
+
+class TestLoopLock:
+    """Test loop_lock."""
+
+    def test_contended_lock_works_across_event_loops(self):
+        """Test successive asyncio.run calls can each contend on the lock."""
+        locks = weakref.WeakKeyDictionary()
+
+        async def contend():
+            async def hold():
+                async with loop_lock(locks):
+                    await asyncio.sleep(0)
+
+            await asyncio.gather(hold(), hold())
+            return loop_lock(locks)
+
+        first = asyncio.run(contend())
+        second = asyncio.run(contend())
+
+        assert first is not second
@@ -0,0 +1,115 @@
+"""Unit tests for microsoft_ads module."""
+
+import asyncio
+import os
+import random
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.integrations.microsoft_ads import MicrosoftAdMetrics, MicrosoftAdsClient
+
+FIELD_TYPES = {
+    "campaign_id": str,
+    "campaign_name": str,
+    "impressions": int,
+    "clicks": int,
+    "spend": float,
+    "conversions": int,
+    "ctr": float,
+    "cpc": float,
+    "conversion_rate": float,
+    "date": str,
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Microsoft Ads client in mock mode with a placeholder token."""
+    monkeypatch.setenv("MICROSOFT_ADS_DEVELOPER_TOKEN", "dev_token")
+    monkeypatch.setenv("MOCK_MICROSOFT", "true")
+    client = MicrosoftAdsClient()
+    client.access_token = "access_token"
+    return client
+
+
+def assert_field_types(metrics: MicrosoftAdMetrics) -> None:
+    """Generated metrics carry exactly the model's declared field types."""
+    assert set(metrics.model_dump()) == set(FIELD_TYPES)
+    for field, expected_type in FIELD_TYPES.items():
+        assert type(getattr(metrics, field)) is expected_type, field
+
+
+class TestMicrosoftAdMetricsConstruction:
+    """Test metrics generated by the mock data paths."""
+
+    def test_mock_campaigns_field_types(self, client):
+        """Test mock campaign metrics have the declared field types."""
+        campaigns = asyncio.run(client.get_campaigns("2024-01-01", "2024-01-07"))
+
+        assert len(campaigns) == 3
+        for metrics in campaigns:
+            assert_field_types(metrics)
+            assert metrics.date == "2024-01-01"
+
+    def test_campaign_metrics_field_types(self, client):
+        """Test per-campaign metrics have the declared field types."""
+        metrics = asyncio.run(
+            client.get_campaign_metrics(
+                "ms_camp_1", datetime(2024, 1, 1), datetime(2024, 1, 7)
+            )
+        )
+
+        assert_field_types(metrics)
+        assert metrics.campaign_id == "ms_camp_1"
+        assert metrics == MicrosoftAdMetrics.model_validate(metrics.model_dump())
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+MOCK_CAMPAIGNS_SCRIPT = """
+import asyncio, os
+os.environ["MICROSOFT_ADS_DEVELOPER_TOKEN"] = "dev_token"
+os.environ["MOCK_MICROSOFT"] = "true"
+from src.integrations.microsoft_ads import MicrosoftAdsClient
+campaigns = asyncio.run(MicrosoftAdsClient().get_campaigns("2024-01-01", "2024-01-07"))
+print([metrics.model_dump() for metrics in campaigns])
+"""
+
+
+class TestMockDataDeterminism:
+    """Test mock metrics are stable and leave global state alone."""
+
+    def test_mock_campaigns_match_across_processes(self):
+        """Test mock rows do not depend on the per-process str hash seed."""
+        outputs = [
+            subprocess.run(
+                [sys.executable, "-c", MOCK_CAMPAIGNS_SCRIPT],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                cwd=REPO_ROOT,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            for seed in ("1", "2")
+        ]
+
+        assert outputs[0]
+        assert outputs[0] == outputs[1]
+
+    def test_mock_metrics_leave_global_random_state(self, client):
+        """Test generating mock metrics does not reseed the random module."""
+        random.seed(1234)
+        expected = random.random()
+        random.seed(1234)
+
+        asyncio.run(
+            client.get_campaign_metrics(
+                "ms_camp_1", datetime(2024, 1, 1), datetime(2024, 1, 7)
+            )
+        )
+
+        assert random.random() == expected
@@ -0,0 +1,109 @@
+"""Unit tests for multi_platform_pipeline module."""
+
+from datetime import date, datetime, timezone
+
+from google.api_core.exceptions import Forbidden, NotFound, TooManyRequests
+
+from src.etl import multi_platform_pipeline as pipeline_module
+from src.etl.multi_platform_pipeline import (
+    AD_METRICS_SCHEMA,
+    _campaign_metric_columns,
+    _derive_metrics,
+    _is_rate_limited,
+    _metric_columns_to_arrow,
+    _new_metric_columns,
+)
+from src.integrations.reddit_ads import RedditAdMetrics
+
+
+class TestLoadRetry:
+    """Test which BigQuery load errors are retried."""
+
+    def test_retries_rate_limit_exceeded_403(self):
+        """Test 403 rateLimitExceeded from load jobs is retried."""
+        exc = Forbidden(
+            "Exceeded rate limits", errors=[{"reason": "rateLimitExceeded"}]
+        )
+
+        assert _is_rate_limited(exc)
+
+    def test_retries_429(self):
+        """Test HTTP 429 is retried."""
+        assert _is_rate_limited(TooManyRequests("Too many requests"))
+
+    def test_does_not_retry_other_errors(self):
+        """Test permission and missing-table errors are not retried."""
+        assert not _is_rate_limited(
+            Forbidden("Access denied", errors=[{"reason": "accessDenied"}])
+        )
+        assert not _is_rate_limited(Forbidden("Access denied"))
+        assert not _is_rate_limited(NotFound("Table not found"))
+
+
+def _campaign_rows():
+    """Two Reddit-style campaign rows, one with no clicks or conversions."""
+    return [
+        RedditAdMetrics(
+            campaign_id="c1", campaign_name="Brand", impressions=1000, clicks=50,
+            spend=100.0, conversions=5, date="2024-01-01",
+        ),
+        RedditAdMetrics(
+            campaign_id="c2", campaign_name="Launch", impressions=0, clicks=0,
+            spend=0.0, conversions=0, date="2024-01-02",
+        ),
+    ]
+
+
+class TestDeriveMetrics:
+    """Test derived ad_metrics columns."""
+
+    def test_derived_ratios(self):
+        """Test ratios are computed per row and zero where undefined."""
+        columns = _campaign_metric_columns(
+            _campaign_rows(), "reddit", "reddit_account", "Reddit Account"
+        )
+
+        _derive_metrics(columns, revenue_per_conversion=100.0)
+
+        assert columns["ctr"].tolist() == [5.0, 0.0]
+        assert columns["cpc"].tolist() == [2.0, 0.0]
+        assert columns["cpm"].tolist() == [100.0, 0.0]
+        assert columns["conversion_rate"].tolist() == [10.0, 0.0]
+        assert columns["cost_per_conversion"].tolist() == [20.0, 0.0]
+        assert columns["revenue"].tolist() == [500.0, 0.0]
+        assert columns["roas"].tolist() == [5.0, 0.0]
+
+
+class TestMetricColumnsToArrow:
+    """Test the ad_metrics Arrow table builder."""
+
+    def test_builds_table_matching_schema(self, monkeypatch):
+        """Test the table has the load schema, typed dates and filled defaults."""
+        monkeypatch.setattr(pipeline_module, "STORE_RAW", False)
+        synced_at = datetime(2024, 1, 3, 12, 0, tzinfo=timezone.utc)
+        columns = _campaign_metric_columns(
+            _campaign_rows(), "reddit", "reddit_account", "Reddit Account"
+        )
+        _derive_metrics(columns, revenue_per_conversion=100.0)
+
+        table = _metric_columns_to_arrow(columns, synced_at)
+
+        assert table.schema == AD_METRICS_SCHEMA
+        assert table.num_rows == 2
+        assert table["date"].to_pylist() == [date(2024, 1, 1), date(2024, 1, 2)]
+        assert table["platform"].to_pylist() == ["reddit", "reddit"]
+        assert table["campaign_id"].to_pylist() == ["c1", "c2"]
+        assert table["spend"].to_pylist() == [100.0, 0.0]
+        assert table["ctr"].to_pylist() == [5.0, 0.0]
+        assert table["adgroup_id"].null_count == 2
+        assert table["raw"].null_count == 2
+        assert table["updated_at"].to_pylist() == [synced_at, synced_at]
+
+    def test_empty_columns_build_empty_table(self):
+        """Test a sync with no rows yields an empty table of the same schema."""
+        table = _metric_columns_to_arrow(
+            _new_metric_columns(), datetime(2024, 1, 3, tzinfo=timezone.utc)
+        )
+
+        assert table.schema == AD_METRICS_SCHEMA
+        assert table.num_rows == 0
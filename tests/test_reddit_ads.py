@@ -0,0 +1,153 @@
+"""Unit tests for reddit_ads module."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+from cachetools import TTLCache
+
+from src.integrations import reddit_ads
+from src.integrations.reddit_ads import TOKEN_EXPIRY_SKEW, RedditAdsClient
+
+
+class FakeResponse:
+    """Minimal aiohttp response returning a JSON body."""
+
+    def __init__(self, payload: dict, status: int = 200):
+        self.status = status
+        self._body = orjson.dumps(payload)
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self) -> str:
+        return self._body.decode()
+
+    async def __aenter__(self):
+        # Yield like a real request, so concurrent callers interleave
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+class FakeSession:
+    """Records requests and answers them with canned JSON payloads."""
+
+    def __init__(self, token_payload: dict, metrics_payload: dict | None = None):
+        self.token_payload = token_payload
+        self.metrics_payload = metrics_payload or {}
+        self.posts = 0
+        self.gets = 0
+
+    def post(self, url, **kwargs):
+        self.posts += 1
+        return FakeResponse(self.token_payload)
+
+    def get(self, url, **kwargs):
+        self.gets += 1
+        return FakeResponse(self.metrics_payload)
+
+
+@pytest.fixture(autouse=True)
+def reddit_env(monkeypatch):
+    """Placeholder credentials and empty module-level caches for every test."""
+    monkeypatch.setenv("REDDIT_CLIENT_ID", "client_id")
+    monkeypatch.setenv("REDDIT_CLIENT_SECRET", "client_secret")
+    monkeypatch.setattr(reddit_ads, "_token_cache", {})
+    monkeypatch.setattr(reddit_ads, "_campaigns_cache", TTLCache(maxsize=8, ttl=300))
+    monkeypatch.setattr(reddit_ads, "_metrics_cache", TTLCache(maxsize=8, ttl=300))
+
+
+def authenticate(session: FakeSession) -> RedditAdsClient:
+    """Authenticate a new client over the fake session."""
+    client = RedditAdsClient(session=session)
+    assert asyncio.run(client.authenticate())
+    return client
+
+
+class TestTokenCache:
+    """Test access token reuse across clients."""
+
+    def test_token_reused_by_later_clients(self):
+        """Test a second client reuses the cached token without a request."""
+        session = FakeSession({"access_token": "token_1", "expires_in": 3600})
+
+        first = authenticate(session)
+        second = authenticate(session)
+
+        assert session.posts == 1
+        assert first.access_token == second.access_token == "token_1"
+
+    def test_token_expires_skew_seconds_early(self):
+        """Test the cached token is dropped TOKEN_EXPIRY_SKEW before expiry."""
+        session = FakeSession({"access_token": "token_1", "expires_in": 3600})
+
+        authenticate(session)
+
+        _, expires_at = reddit_ads._token_cache[("client_id", "ads_read")]
+        assert expires_at == pytest.approx(
+            time.monotonic() + 3600 - TOKEN_EXPIRY_SKEW, abs=5
+        )
+
+    def test_token_within_skew_is_refreshed(self):
+        """Test a token expiring within the skew window is requested again."""
+        session = FakeSession(
+            {"access_token": "token_1", "expires_in": TOKEN_EXPIRY_SKEW}
+        )
+
+        authenticate(session)
+        authenticate(session)
+
+        assert session.posts == 2
+
+    def test_concurrent_authentication_across_event_loops(self):
+        """Test concurrent first-time logins work under successive event loops."""
+        session = FakeSession(
+            {"access_token": "token_1", "expires_in": TOKEN_EXPIRY_SKEW}
+        )
+
+        async def login_concurrently():
+            clients = [RedditAdsClient(session=session) for _ in range(3)]
+            return await asyncio.gather(*(client.authenticate() for client in clients))
+
+        assert asyncio.run(login_concurrently()) == [True] * 3
+        assert asyncio.run(login_concurrently()) == [True] * 3
+
+
+class TestMetricsCache:
+    """Test caching of campaign metrics by date range."""
+
+    def fetch_twice(self, start_date: datetime, end_date: datetime) -> FakeSession:
+        """Fetch one campaign's metrics with two clients sharing a session."""
+        session = FakeSession(
+            {"access_token": "token_1", "expires_in": 3600},
+            {"data": {"impressions": 1000, "clicks": 50, "spend": 100.0, "conversions": 5}},
+        )
+        for _ in range(2):
+            client = authenticate(session)
+            metrics = asyncio.run(
+                client.get_campaign_metrics("c1", start_date, end_date)
+            )
+            assert metrics.clicks == 50
+        return session
+
+    def test_closed_range_served_from_cache(self):
+        """Test a range that ended before today is fetched once."""
+        end_date = datetime.now() - timedelta(days=1)
+
+        session = self.fetch_twice(end_date - timedelta(days=6), end_date)
+
+        assert session.gets == 1
+
+    def test_range_including_today_fetched_fresh(self):
+        """Test a range ending today is fetched on every call."""
+        end_date = datetime.now()
+
+        session = self.fetch_twice(end_date - timedelta(days=6), end_date)
+
+        assert session.gets == 2
+